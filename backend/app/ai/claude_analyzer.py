@@ -3,12 +3,44 @@ Claude AI Analyzer
 Analyzes trading setups using Anthropic Claude
 """
 import logging
-import json
+import orjson
+import re
+import traceback
+from types import MappingProxyType
 from typing import Dict, Optional, List
 from anthropic import AsyncAnthropic
 
 logger = logging.getLogger(__name__)
 
+# Timeframe-specific take-profit guidance (shared with GroqAnalyzer)
+TF_TARGETS = MappingProxyType({
+    '15m': 'Take profit should target 1-2% move (scalping - tight stops)',
+    '1h': 'Take profit should target 2-4% move (intraday - medium targets)',
+    '4h': 'Take profit should target 4-8% move (swing trade - wider targets)'
+})
+DEFAULT_TF_TARGET = 'Take profit should be appropriate for the timeframe'
+
+# Body of the first ``` / ```json fence (closing fence optional)
+JSON_FENCE_RE = re.compile(r'```(?:json)?(.*?)(?:```|$)', re.DOTALL)
+
+
+def extract_json_text(content: str) -> str:
+    """Strip markdown code fences around a JSON answer"""
+    match = JSON_FENCE_RE.search(content)
+    return (match.group(1) if match else content).strip()
+
+
+# Shared async clients, one per API key (reuses the HTTP connection pool)
+_anthropic_clients: Dict[str, AsyncAnthropic] = {}
+
+
+def get_anthropic_client(api_key: str) -> AsyncAnthropic:
+    """Get the shared AsyncAnthropic client for an API key"""
+    client = _anthropic_clients.get(api_key)
+    if client is None:
+        client = _anthropic_clients[api_key] = AsyncAnthropic(api_key=api_key)
+    return client
+
 
 class ClaudeAnalyzer:
     def __init__(self, api_key: str):
@@ -17,7 +49,7 @@ class ClaudeAnalyzer:
             logger.error("❌ Anthropic API key not provided!")
             self.client = None
         else:
-            self.client = AsyncAnthropic(api_key=api_key)
+            self.client = get_anthropic_client(api_key)
             logger.info("✅ Claude analyzer initialized")
     
     def is_available(self) -> bool:
@@ -62,12 +94,7 @@ class ClaudeAnalyzer:
             ])
             
             # Timeframe-specific targets
-            tf_targets = {
-                '15m': 'Take profit should target 1-2% move (scalping - tight stops)',
-                '1h': 'Take profit should target 2-4% move (intraday - medium targets)',
-                '4h': 'Take profit should target 4-8% move (swing trade - wider targets)'
-            }
-            target_guidance = tf_targets.get(timeframe, 'Take profit should be appropriate for the timeframe')
+            target_guidance = TF_TARGETS.get(timeframe, DEFAULT_TF_TARGET)
             
             # Prepare prompt
             prompt = f"""You are an expert institutional crypto trader analyzing {symbol} on {timeframe} timeframe.
@@ -117,12 +144,7 @@ If the setup is unclear or risky, set valid to false and confidence below 60."""
             logger.info(f"📄 AI response: {content[:200]}...")
             
             # Extract JSON
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0]
-            
-            result = json.loads(content.strip())
+            result = orjson.loads(extract_json_text(content))
             result['symbol'] = symbol
             result['timeframe'] = timeframe
             result['current_price'] = current_price
@@ -134,7 +156,6 @@ If the setup is unclear or risky, set valid to false and confidence below 60."""
             
         except Exception as e:
             logger.error(f"❌ AI analysis error for {symbol}: {e}")
-            import traceback
             logger.error(traceback.format_exc())
             return None
 
@@ -3,12 +3,25 @@ Groq AI Analyzer (Alternative to Claude)
 Ultra-fast inference with Llama models
 """
 import logging
-import json
-import asyncio
+import orjson
+import traceback
 from typing import Dict, Optional, List
+from .claude_analyzer import TF_TARGETS, DEFAULT_TF_TARGET, extract_json_text
 
 logger = logging.getLogger(__name__)
 
+# Shared async clients, one per API key (reuses the HTTP connection pool)
+_groq_clients: Dict[str, object] = {}
+
+
+def get_groq_client(api_key: str):
+    """Get the shared AsyncGroq client for an API key (ImportError if groq is missing)"""
+    client = _groq_clients.get(api_key)
+    if client is None:
+        from groq import AsyncGroq
+        client = _groq_clients[api_key] = AsyncGroq(api_key=api_key)
+    return client
+
 
 class GroqAnalyzer:
     def __init__(self, api_key: str):
@@ -18,8 +31,7 @@ class GroqAnalyzer:
             self.client = None
         else:
             try:
-                from groq import Groq
-                self.client = Groq(api_key=api_key)
+                self.client = get_groq_client(api_key)
                 logger.info("✅ Groq analyzer initialized (llama-3.3-70b-versatile)")
             except ImportError:
                 logger.error("❌ Groq package not installed. Run: pip install groq")
@@ -61,12 +73,7 @@ class GroqAnalyzer:
             ])
             
             # Timeframe-specific targets (same as Claude for consistency)
-            tf_targets = {
-                '15m': 'Take profit should target 1-2% move (scalping - tight stops)',
-                '1h': 'Take profit should target 2-4% move (intraday - medium targets)',
-                '4h': 'Take profit should target 4-8% move (swing trade - wider targets)'
-            }
-            target_guidance = tf_targets.get(timeframe, 'Take profit should be appropriate for the timeframe')
+            target_guidance = TF_TARGETS.get(timeframe, DEFAULT_TF_TARGET)
             
             # Prepare prompt (same as Claude for consistency)
             prompt = f"""You are an expert institutional crypto trader analyzing {symbol} on {timeframe} timeframe.
@@ -101,11 +108,10 @@ Consider:
 Be critical - only recommend trades with clear, high-probability setups. 
 If the setup is unclear or risky, set valid to false and confidence below 60."""
 
-            # Call Groq (wrap sync call in async for non-blocking)
+            # Call Groq (async client - no worker thread per request)
             logger.info(f"🚀 Calling Groq AI for {symbol}...")
             
-            response = await asyncio.to_thread(
-                self.client.chat.completions.create,
+            response = await self.client.chat.completions.create(
                 model="llama-3.3-70b-versatile",  # Fast and accurate
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.2,
@@ -117,12 +123,7 @@ If the setup is unclear or risky, set valid to false and confidence below 60."""
             logger.info(f"📄 Groq response: {content[:200]}...")
             
             # Extract JSON
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0]
-            
-            result = json.loads(content.strip())
+            result = orjson.loads(extract_json_text(content))
             result['symbol'] = symbol
             result['timeframe'] = timeframe
             result['current_price'] = current_price
@@ -134,7 +135,6 @@ If the setup is unclear or risky, set valid to false and confidence below 60."""
             
         except Exception as e:
             logger.error(f"❌ Groq analysis error for {symbol}: {e}")
-            import traceback
             logger.error(traceback.format_exc())
             return None
 
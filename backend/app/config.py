@@ -22,6 +22,9 @@ class Settings(BaseSettings):
     MIN_CONFIDENCE_SCORE: int = 60
     MAX_ALERTS_PER_SCAN: int = 3
     AUTO_SCAN_AI_PROVIDER: str = "claude"  # 'claude' or 'groq' for auto-scans
+    LOG_FORMAT: str = "text"  # 'text' or 'json' (structured logs for Railway)
+    THREAD_POOL_WORKERS: int = 16  # Cap for to_thread work (SQLite, feedparser, yfinance, pandas)
+    REDIS_URL: str = ""  # Optional - shared cache across workers (e.g. redis://localhost:6379/0)
     
     class Config:
         env_file = ".env"
@@ -1,7 +1,7 @@
 """
 Database models for trade tracking
 """
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Text, JSON
+from sqlalchemy import Column, Integer, BigInteger, String, Float, Boolean, DateTime, Text, JSON
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
 
@@ -152,3 +152,17 @@ class NewsArticle(Base):
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
 
+
+class OHLCVCandle(Base):
+    """Cached exchange candle (closed history is immutable, only the tail changes)"""
+    __tablename__ = 'ohlcv_candles'
+    
+    symbol = Column(String, primary_key=True)
+    timeframe = Column(String, primary_key=True)
+    timestamp = Column(BigInteger, primary_key=True)  # Candle open, epoch ms
+    
+    open = Column(Float, nullable=False)
+    high = Column(Float, nullable=False)
+    low = Column(Float, nullable=False)
+    close = Column(Float, nullable=False)
+    volume = Column(Float, nullable=False)
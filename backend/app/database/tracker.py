@@ -182,7 +182,8 @@ class TradeTracker:
         try:
             total_setups = db.query(TradeSetup).count()
             
-            closed_trades = db.query(TradeSetup).filter(
+            # Only the two columns needed, as plain tuples (no ORM objects)
+            closed_trades = db.query(TradeSetup.status, TradeSetup.profit_loss_pct).filter(
                 TradeSetup.status.in_(['hit_tp', 'hit_sl'])
             ).all()
             
@@ -202,20 +203,24 @@ class TradeTracker:
                     'total_scans': db.query(ScanResult).count()
                 }
             
-            winners = [t for t in closed_trades if t.status == 'hit_tp']
-            losers = [t for t in closed_trades if t.status == 'hit_sl']
+            # Single pass: counts, gross profit/loss, net P/L
+            win_count = loss_count = 0
+            gross_profit = gross_loss = total_pl = 0.0
+            for status, profit_loss_pct in closed_trades:
+                profit_loss_pct = profit_loss_pct or 0.0
+                total_pl += profit_loss_pct
+                if status == 'hit_tp':
+                    win_count += 1
+                    gross_profit += profit_loss_pct
+                else:
+                    loss_count += 1
+                    gross_loss += abs(profit_loss_pct)
             
-            win_count = len(winners)
-            loss_count = len(losers)
-            
-            win_rate = (win_count / len(closed_trades)) * 100 if closed_trades else 0
+            win_rate = (win_count / len(closed_trades)) * 100
             loss_rate = 100 - win_rate
             
-            avg_profit = sum([t.profit_loss_pct for t in winners]) / win_count if winners else 0
-            avg_loss = sum([abs(t.profit_loss_pct) for t in losers]) / loss_count if losers else 0
-            
-            # Total P/L (net profit/loss)
-            total_pl = sum([t.profit_loss_pct for t in closed_trades])
+            avg_profit = gross_profit / win_count if win_count else 0
+            avg_loss = gross_loss / loss_count if loss_count else 0
             
             # Expected Value per trade
             expected_value = (win_rate / 100 * avg_profit) - (loss_rate / 100 * avg_loss)
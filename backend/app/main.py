@@ -1,15 +1,31 @@
 """
 Trading Bot with AI Vision - Main FastAPI Application
 """
+import os
 import logging
 import asyncio
-from fastapi import FastAPI, BackgroundTasks
+import hashlib
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+import msgspec
+import orjson
+from fastapi import FastAPI, APIRouter, BackgroundTasks, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.requests import Request
+from starlette.responses import Response
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.decorator import cache
 
 from .config import settings
+from .metrics import stage_metrics
+from .redis_cache import create_redis, RedisBackend
 from .scanner import TradingScanner
+from .market_data.binance_stream import BinanceStream
 from .telegram import TelegramNotifier
 from .database import init_db
 from .database.tracker import trade_tracker
@@ -17,21 +33,58 @@ from .scheduler import AutoScanner
 from .scheduler.auto_scan_commodities import AutoScannerCommodities
 from .scheduler.auto_scan_indices import AutoScannerIndices
 from .scheduler.auto_news import AutoNewsScheduler
+from .news.feeds import news_scraper
 from .trade_tracking import TradeTrackerWorker
 from .routes import commodities, indices, news, stocks, admin
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per log line (indexable by Railway), encoded with orjson"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage()
+        }
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload).decode()
+
+
+# Configure logging (LOG_FORMAT=json for structured output in production)
+log_handler = logging.StreamHandler()
+if settings.LOG_FORMAT == "json":
+    log_handler.setFormatter(JsonFormatter())
+else:
+    log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[log_handler])
 logger = logging.getLogger(__name__)
 
+
+class HealthCheckAccessFilter(logging.Filter):
+    """Drop uvicorn access log lines for health-check polling"""
+
+    QUIET_PATHS = frozenset({"/", "/api/health"})
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # uvicorn.access args: (client_addr, method, full_path, http_version, status_code)
+        args = record.args
+        if isinstance(args, tuple) and len(args) >= 3:
+            return args[2].split("?", 1)[0] not in self.QUIET_PATHS
+        return True
+
+
+logging.getLogger("uvicorn.access").addFilter(HealthCheckAccessFilter())
+
 # Global instances
 scanner: TradingScanner = None
+binance_stream: BinanceStream = None
+redis_client = None
 telegram: TelegramNotifier = None
 auto_scanner: AutoScanner = None
 auto_scanner_commodities: AutoScannerCommodities = None
@@ -39,27 +92,95 @@ auto_scanner_indices: AutoScannerIndices = None
 auto_news_scheduler: AutoNewsScheduler = None
 tracker_worker: TradeTrackerWorker = None
 
+class RootResponse(msgspec.Struct):
+    """Payload of GET /"""
+    status: str
+    service: str
+    version: str
+
+
+class HealthResponse(msgspec.Struct):
+    """Payload of GET /api/health"""
+    status: str
+    scanner_available: bool
+    telegram_available: bool
+    ai_claude_available: bool
+    ai_groq_available: bool
+
+
+json_encoder = msgspec.json.Encoder()
+
+# Body for unhandled errors - literal bytes, no encoder on the failure path
+INTERNAL_ERROR_BYTES: bytes = b'{"success":false,"error":"Internal Server Error"}'
+
+# Static infra payloads, serialized once (served by plain Starlette routes)
+ROOT_BYTES: bytes = json_encoder.encode(RootResponse(
+    status="online",
+    service="AI Trading Bot",
+    version="1.0.0"
+))
+
+# Health payload - service availability is fixed once startup completes
+health_bytes: bytes = json_encoder.encode(HealthResponse(
+    status="online",
+    scanner_available=False,
+    telegram_available=False,
+    ai_claude_available=False,
+    ai_groq_available=False
+))
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag for a precomputed payload"""
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+
+ROOT_ETAG: str = make_etag(ROOT_BYTES)
+health_etag: str = make_etag(health_bytes)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events"""
-    global scanner, telegram, auto_scanner, auto_scanner_commodities, auto_scanner_indices, auto_news_scheduler, tracker_worker
+    global scanner, binance_stream, redis_client, telegram, auto_scanner, auto_scanner_commodities, auto_scanner_indices, auto_news_scheduler, tracker_worker, health_bytes, health_etag
     
     logger.info("🚀 Starting Trading Bot...")
     
+    # Bounded pool behind asyncio.to_thread / run_in_executor (blocking DB, feeds, Yahoo)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=settings.THREAD_POOL_WORKERS, thread_name_prefix="blocking")
+    )
+    
     # Initialize database
     init_db()
     
+    # Response cache for near-static endpoints (Redis shares it across workers)
+    redis_client = create_redis(settings.REDIS_URL)
+    if redis_client:
+        FastAPICache.init(RedisBackend(redis_client), prefix="trading-bot")
+        logger.info("✅ Redis cache enabled")
+    else:
+        FastAPICache.init(InMemoryBackend(), prefix="trading-bot")
+    
     # Initialize scanner
     scanner = TradingScanner(
-        binance_key=settings.BINANCE_API_KEY,
-        binance_secret=settings.BINANCE_SECRET,
         claude_key=settings.ANTHROPIC_API_KEY,
         groq_key=settings.GROQ_API_KEY,
         top_n_coins=settings.TOP_N_COINS,
         min_confidence=settings.MIN_CONFIDENCE_SCORE
     )
     
+    # Share the OHLCV memo across workers through Redis (when configured)
+    scanner.fetcher.redis = redis_client
+    
+    # Load Binance markets now so the first scan doesn't pay for it
+    await scanner.fetcher.warmup()
+    
+    # Kline stream keeps the top pairs' candles current (REST only backfills)
+    binance_stream = BinanceStream(scanner.fetcher, top_n=settings.TOP_N_COINS)
+    scanner.fetcher.stream = binance_stream
+    binance_stream.start()
+    
     # Initialize Telegram
     telegram = TelegramNotifier(
         bot_token=settings.TELEGRAM_BOT_TOKEN,
@@ -71,11 +192,11 @@ async def lifespan(app: FastAPI):
     auto_scanner.start()
     
     # Initialize auto-scanner COMMODITIES (4h scans - Yahoo data with 30min delay)
-    auto_scanner_commodities = AutoScannerCommodities(telegram, trade_tracker)
+    auto_scanner_commodities = AutoScannerCommodities(scanner, telegram, trade_tracker)
     auto_scanner_commodities.start()
     
     # Initialize auto-scanner INDICES (4h scans - Yahoo data with 1h delay)
-    auto_scanner_indices = AutoScannerIndices(telegram, trade_tracker)
+    auto_scanner_indices = AutoScannerIndices(scanner, telegram, trade_tracker)
     auto_scanner_indices.start()
     
     # Initialize auto news scheduler (3x per day)
@@ -90,6 +211,16 @@ async def lifespan(app: FastAPI):
     )
     asyncio.create_task(tracker_worker.start())
     
+    # Freeze health payload (serialized once, returned as raw bytes)
+    health_bytes = json_encoder.encode(HealthResponse(
+        status="online",
+        scanner_available=scanner is not None,
+        telegram_available=telegram.is_available(),
+        ai_claude_available=scanner.claude.is_available(),
+        ai_groq_available=scanner.groq.is_available()
+    ))
+    health_etag = make_etag(health_bytes)
+    
     logger.info("✅ All services initialized:")
     logger.info("   📊 CRYPTO 4H Auto-scan: 00:00, 04:00, 08:00, 12:00, 16:00, 20:00 UTC")
     logger.info("   🥇 COMMODITIES 4H Auto-scan: 00:30, 04:30, 08:30, 12:30, 16:30, 20:30 UTC (+30min delay)")
@@ -110,6 +241,13 @@ async def lifespan(app: FastAPI):
         auto_news_scheduler.stop()
     if tracker_worker:
         tracker_worker.stop()
+    await news_scraper.close()
+    if binance_stream:
+        await binance_stream.stop()
+    if scanner:
+        await scanner.fetcher.close()
+    if redis_client:
+        await redis_client.aclose()
 
 
 # Create FastAPI app
@@ -117,9 +255,17 @@ app = FastAPI(
     title="AI Trading Bot",
     description="Trading bot with GPT-4o Vision analysis",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # orjson; serializes numpy values natively
 )
 
+@app.exception_handler(Exception)
+async def global_exception_handler(request: Request, exc: Exception) -> Response:
+    """Log unhandled errors and return a fixed 500 body"""
+    logger.exception(f"❌ Unhandled error on {request.method} {request.url.path}: {exc}")
+    return Response(INTERNAL_ERROR_BYTES, status_code=500, media_type="application/json")
+
+
 # CORS
 app.add_middleware(
     CORSMiddleware,
@@ -129,34 +275,47 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Include routers
-app.include_router(admin.router, tags=["admin"])  # Admin routes (no prefix for /api/admin in router)
-app.include_router(commodities.router, prefix="/api/commodities", tags=["commodities"])
-app.include_router(indices.router, prefix="/api/indices", tags=["indices"])
-app.include_router(news.router, prefix="/api/news", tags=["news"])
-app.include_router(stocks.router, prefix="/api/stocks", tags=["stocks"])
+# Compress JSON responses (scan results, setups, articles); level 5 balances CPU vs ratio
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
+# Include routers - grouped under a single /api router
+# (module, prefix, tags); admin router declares its own /admin prefix
+API_ROUTERS = (
+    (admin, "", ["admin"]),
+    (commodities, "/commodities", ["commodities"]),
+    (indices, "/indices", ["indices"]),
+    (news, "/news", ["news"]),
+    (stocks, "/stocks", ["stocks"]),
+)
+
+api = APIRouter(prefix="/api")
+for module, prefix, tags in API_ROUTERS:
+    api.include_router(module.router, prefix=prefix, tags=tags)
+app.include_router(api)
 
 
-@app.get("/")
-async def root():
+# Infra endpoints polled by load balancers: plain Starlette routes skip
+# FastAPI dependency injection and response serialization entirely
+def etag_response(request: Request, body: bytes, etag: str) -> Response:
+    """Serve precomputed JSON, or an empty 304 when the client already has it"""
+    headers = {"ETag": etag, "Cache-Control": "public,max-age=60"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+async def root(request: Request) -> Response:
     """Health check"""
-    return {
-        "status": "online",
-        "service": "AI Trading Bot",
-        "version": "1.0.0"
-    }
+    return etag_response(request, ROOT_BYTES, ROOT_ETAG)
 
 
-@app.get("/api/health")
-async def health():
+async def health(request: Request) -> Response:
     """Detailed health check"""
-    return {
-        "status": "online",
-        "scanner_available": scanner is not None,
-        "telegram_available": telegram.is_available() if telegram else False,
-        "ai_claude_available": scanner.claude.is_available() if scanner else False,
-        "ai_groq_available": scanner.groq.is_available() if scanner else False
-    }
+    return etag_response(request, health_bytes, health_etag)
+
+
+app.add_route("/", root, methods=["GET"], include_in_schema=False)
+app.add_route("/api/health", health, methods=["GET"], include_in_schema=False)
 
 
 @app.post("/api/telegram/set-topic")
@@ -199,8 +358,9 @@ async def run_scan(top_n: int = 15, ai_provider: str = 'claude'):
     try:
         logger.info(f"🔍 Starting market scan for top {top_n} crypto with {ai_provider.upper()}...")
         
-        # Create scan session in database
-        scan_id = trade_tracker.create_scan_session(
+        # Create scan session in database (SQLite I/O off the event loop)
+        scan_id = await asyncio.to_thread(
+            trade_tracker.create_scan_session,
             scan_type=f'manual_{ai_provider}',
             top_n=top_n,
             timeframes=['15m', '1h', '4h']
@@ -225,11 +385,12 @@ async def run_scan(top_n: int = 15, ai_provider: str = 'claude'):
         # Save setups to database
         if setups:
             for setup in setups:
-                trade_tracker.save_setup(setup, scan_id=scan_id)
+                await asyncio.to_thread(trade_tracker.save_setup, setup, scan_id=scan_id)
         
         # Complete scan session
         high_conf_count = len([s for s in setups if s.get('confidence', 0) >= 60]) if setups else 0
-        trade_tracker.complete_scan_session(
+        await asyncio.to_thread(
+            trade_tracker.complete_scan_session,
             scan_id=scan_id,
             setups_count=len(setups) if setups else 0,
             high_confidence_count=high_conf_count
@@ -237,7 +398,6 @@ async def run_scan(top_n: int = 15, ai_provider: str = 'claude'):
         
         # Send to Telegram in background (top 5 only)
         if setups and telegram and telegram.is_available():
-            import asyncio
             top_5_setups = sorted(setups, key=lambda x: x.get('confidence', 0), reverse=True)[:5]
             asyncio.create_task(send_telegram_alerts(top_5_setups))
         
@@ -251,7 +411,6 @@ async def run_scan(top_n: int = 15, ai_provider: str = 'claude'):
         
     except Exception as e:
         logger.error(f"❌ Scan error: {e}")
-        import traceback
         logger.error(traceback.format_exc())
         return {
             "success": False,
@@ -327,7 +486,6 @@ async def test_scan_one_symbol(ai_provider: str = 'claude'):
         
     except Exception as e:
         logger.error(f"❌ Test scan error: {e}")
-        import traceback
         error_trace = traceback.format_exc()
         logger.error(error_trace)
         return {
@@ -378,7 +536,6 @@ async def perform_scan_and_alert():
         
     except Exception as e:
         logger.error(f"❌ Scan error: {e}")
-        import traceback
         logger.error(traceback.format_exc())
         # Try to send error to telegram
         if telegram and telegram.is_available():
@@ -391,6 +548,40 @@ async def perform_scan_and_alert():
                 pass
 
 
+# Upper bound on symbol x timeframe combinations per batch quick scan
+MAX_QUICK_SCAN_BATCH = 20
+
+
+@app.get("/api/scan/quick")
+async def quick_scan_batch(symbols: str, timeframes: str = '15m'):
+    """
+    Quick scan several symbols/timeframes concurrently
+    
+    Args:
+        symbols: Comma-separated pairs (e.g. BTC/USDT,ETH/USDT)
+        timeframes: Comma-separated timeframes (e.g. 15m,1h)
+    """
+    if not scanner:
+        return {"error": "Scanner not initialized"}
+    
+    symbol_list = [s.strip().upper() for s in symbols.split(',') if s.strip()]
+    tf_list = [tf.strip() for tf in timeframes.split(',') if tf.strip()]
+    
+    if not symbol_list or not tf_list:
+        return {"success": False, "error": "No symbols or timeframes given"}
+    
+    if len(symbol_list) * len(tf_list) > MAX_QUICK_SCAN_BATCH:
+        return {"success": False, "error": f"Max {MAX_QUICK_SCAN_BATCH} symbol/timeframe combinations per batch"}
+    
+    results = await scanner.quick_scan_many(symbol_list, tf_list)
+    
+    return {
+        "success": True,
+        "count": len(results),
+        "data": results
+    }
+
+
 @app.get("/api/scan/quick/{symbol}")
 async def quick_scan(symbol: str, timeframe: str = '15m'):
     """
@@ -407,28 +598,105 @@ async def quick_scan(symbol: str, timeframe: str = '15m'):
     }
 
 
+# Candles sent as the initial snapshot on /ws/klines
+KLINE_SNAPSHOT_LIMIT = 100
+
+
+async def _wait_disconnect(websocket: WebSocket):
+    """Read (and ignore) client messages until the client goes away"""
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+
+
+@app.websocket("/ws/klines/{base}/{quote}/{timeframe}")
+async def kline_socket(websocket: WebSocket, base: str, quote: str, timeframe: str):
+    """
+    Live candles for one pair (e.g. /ws/klines/BTC/USDT/15m)
+    Sends a snapshot of the last candles, then one message per Binance kline event
+    """
+    await websocket.accept()
+    
+    symbol = f"{base.upper()}/{quote.upper()}"
+    fetcher = scanner.fetcher if scanner else None
+    if not fetcher or not binance_stream:
+        await websocket.close(code=1011, reason="Stream not initialized")
+        return
+    if symbol not in (fetcher.exchange.markets or {}) or timeframe not in fetcher.exchange.timeframes:
+        await websocket.close(code=1008, reason="Unknown symbol or timeframe")
+        return
+    
+    # Subscribe before the snapshot so no event falls between the two
+    queue = await binance_stream.subscribe(symbol, timeframe)
+    if queue is None:
+        await websocket.close(code=1008, reason="Too many live series")
+        return
+    
+    # Watch the client side too - a quiet series must not keep a dead socket subscribed
+    disconnect = asyncio.create_task(_wait_disconnect(websocket))
+    try:
+        candles = await fetcher.fetch_ohlcv(symbol, timeframe, limit=KLINE_SNAPSHOT_LIMIT)
+        await websocket.send_json({
+            "type": "snapshot",
+            "symbol": symbol,
+            "timeframe": timeframe,
+            "candles": candles or []
+        })
+        
+        while True:
+            event = asyncio.create_task(queue.get())
+            await asyncio.wait({event, disconnect}, return_when=asyncio.FIRST_COMPLETED)
+            if disconnect.done():
+                event.cancel()
+                break
+            
+            candle, closed = event.result()
+            await websocket.send_json({"type": "kline", "candle": candle, "closed": closed})
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.warning(f"⚠️  Kline socket {symbol} {timeframe} closed: {e}")
+    finally:
+        disconnect.cancel()
+        await binance_stream.unsubscribe(symbol, timeframe, queue)
+
+
 @app.get("/api/stats")
+@cache(expire=30)
 async def get_stats():
     """Get overall statistics and learning metrics"""
     try:
-        stats = trade_tracker.get_stats()
+        # Full-table aggregation over SQLite - keep it off the event loop
+        loop = asyncio.get_running_loop()
+        stats = await loop.run_in_executor(None, trade_tracker.get_stats)
         return {
             "success": True,
             "stats": stats
         }
     except Exception as e:
+        # Raised, not returned - @cache would keep serving the error for 30s
         logger.error(f"❌ Error getting stats: {e}")
-        return {
-            "success": False,
-            "error": str(e)
-        }
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/metrics")
+async def get_metrics(reset: bool = False):
+    """Per-stage pipeline timings (fetch, AI analysis, strength) since start/reset"""
+    stages = stage_metrics.snapshot()
+    if reset:
+        stage_metrics.reset()
+    return {
+        "success": True,
+        "stages": stages
+    }
 
 
 @app.get("/api/results")
 async def get_recent_results(limit: int = 20):
     """Get recent scan results"""
     try:
-        scans = trade_tracker.get_recent_scans(limit=limit)
+        scans = await asyncio.to_thread(trade_tracker.get_recent_scans, limit=limit)
         return {
             "success": True,
             "count": len(scans),
@@ -446,7 +714,7 @@ async def get_recent_results(limit: int = 20):
 async def get_scan_setups(scan_id: int):
     """Get all setups from a specific scan"""
     try:
-        setups = trade_tracker.get_setups_by_scan(scan_id)
+        setups = await asyncio.to_thread(trade_tracker.get_setups_by_scan, scan_id)
         return {
             "success": True,
             "count": len(setups),
@@ -468,7 +736,8 @@ async def get_all_setups(
 ):
     """Get all recent setups with optional filters"""
     try:
-        setups = trade_tracker.get_all_setups(
+        setups = await asyncio.to_thread(
+            trade_tracker.get_all_setups,
             limit=limit,
             status=status,
             timeframe=timeframe
@@ -513,5 +782,24 @@ async def test_telegram():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    # Railway sets RAILWAY_ENVIRONMENT; anything else is a local dev run
+    is_dev = os.getenv("RAILWAY_ENVIRONMENT", "local") == "local"
+
+    # Each worker runs its own lifespan (schedulers + trade tracker), so
+    # more than one worker would duplicate auto-scans and Telegram alerts.
+    # Keep 1 by default and let WEB_CONCURRENCY opt in explicitly.
+    workers = 1 if is_dev else int(os.getenv("WEB_CONCURRENCY", "1"))
+
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        reload=is_dev,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        log_level="info" if is_dev else "warning",
+        access_log=is_dev
+    )
 
@@ -1,8 +1,8 @@
 """
 Market Data Module
 """
-from .binance_fetcher import BinanceFetcher
+from .binance_fetcher import BinanceFetcher, get_binance_fetcher
 from .strength_calculator import strength_calculator, MarketStrengthCalculator
 
-__all__ = ['BinanceFetcher', 'strength_calculator', 'MarketStrengthCalculator']
+__all__ = ['BinanceFetcher', 'get_binance_fetcher', 'strength_calculator', 'MarketStrengthCalculator']
 
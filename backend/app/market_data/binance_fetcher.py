@@ -2,64 +2,243 @@
 Binance Data Fetcher
 Fetches top 30 crypto pairs by 24h volume and OHLCV data
 """
-import ccxt
+import ccxt.async_support as ccxt
 import logging
+import heapq
+from operator import itemgetter
 from typing import List, Dict, Optional
 import asyncio
+import random
+import time
+import orjson
+from .ohlcv_cache import ohlcv_cache
+from ..config import settings
+from ..rate_limit import TokenBucket
+from ..single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Seconds a fetched candle set stays fresh, per timeframe (unlisted = no cache)
+OHLCV_TTL = {
+    '1m': 5,
+    '5m': 15,
+    '15m': 30,
+    '1h': 60,
+    '4h': 120,
+    '1d': 300
+}
+
+# Smallest request served from the disk cache (price polls with limit=1 go direct)
+DISK_CACHE_MIN_LIMIT = 20
+
+# Max concurrent OHLCV requests when fanning out over many symbols
+OHLCV_FANOUT = 20
+
+# Seconds the top-pairs-by-volume ranking is reused
+TOP_PAIRS_TTL = 300
+
+# Binance request-weight budget (per minute) and per-call weights
+# (WEIGHT_TICKERS is the unfiltered /ticker/24hr - every symbol)
+WEIGHT_CAPACITY = 1200
+WEIGHT_TICKERS = 80
+WEIGHT_OHLCV = 2
+
+
+def ticker_batch_weight(count: int) -> int:
+    """Weight of GET /ticker/24hr?symbols=[...] for `count` symbols"""
+    if count <= 20:
+        return 2
+    if count <= 100:
+        return 40
+    return 80
+
+# Hardcoded top coins, used when the live ranking is unavailable
+FALLBACK_TOP_PAIRS = (
+    'BTC/USDT', 'ETH/USDT', 'BNB/USDT', 'SOL/USDT', 'XRP/USDT',
+    'ADA/USDT', 'DOGE/USDT', 'AVAX/USDT', 'DOT/USDT', 'MATIC/USDT',
+    'LINK/USDT', 'UNI/USDT', 'ATOM/USDT', 'LTC/USDT', 'NEAR/USDT',
+    'ALGO/USDT', 'FIL/USDT', 'APT/USDT', 'ARB/USDT', 'OP/USDT',
+    'ICP/USDT', 'VET/USDT', 'HBAR/USDT', 'GRT/USDT', 'AAVE/USDT',
+    'EOS/USDT', 'FTM/USDT', 'SAND/USDT', 'MANA/USDT', 'AXS/USDT'
+)
+
+# Transient exchange errors worth retrying (rate limits, timeouts, network blips)
+RETRYABLE_ERRORS = (ccxt.RateLimitExceeded, ccxt.DDoSProtection, ccxt.NetworkError)
+
+
+async def with_retry(call, max_attempts: int = 3, base: float = 0.5, cap: float = 8.0):
+    """
+    Await call() with exponential backoff + jitter on transient ccxt errors
+    Re-raises the last error once attempts are exhausted
+    """
+    for attempt in range(max_attempts):
+        try:
+            return await call()
+        except RETRYABLE_ERRORS as e:
+            if attempt == max_attempts - 1:
+                raise
+            delay = min(cap, base * (2 ** attempt)) + random.uniform(0, 0.25)
+            logger.warning(f"⚠️  {type(e).__name__} from Binance, retrying in {delay:.1f}s ({attempt + 1}/{max_attempts})")
+            await asyncio.sleep(delay)
+
+
+class WeightLimiter(TokenBucket):
+    """
+    Token bucket over Binance's request-weight budget
+    Refills continuously and re-syncs from the X-MBX-USED-WEIGHT-1M header
+    """
+    
+    def __init__(self, capacity: int = WEIGHT_CAPACITY, refill_per_sec: float = WEIGHT_CAPACITY / 60):
+        super().__init__(capacity, refill_per_sec)
+    
+    def sync(self, headers: Optional[Dict]):
+        """Clamp to Binance's own counter so we never think we have more than it does"""
+        if not headers:
+            return
+        used = headers.get('x-mbx-used-weight-1m') or headers.get('X-MBX-USED-WEIGHT-1M')
+        try:
+            used = int(used)
+        except (TypeError, ValueError):
+            return
+        self._drip()
+        self.tokens = min(self.tokens, float(max(0, self.capacity - used)))
+
 
 class BinanceFetcher:
     def __init__(self, api_key: str = "", secret: str = ""):
-        """Initialize Binance client"""
+        """Initialize Binance client (async ccxt - pooled keep-alive aiohttp session)"""
         self.exchange = ccxt.binance({
             'apiKey': api_key,
             'secret': secret,
-            'enableRateLimit': True,
+            # Throttling is done by WeightLimiter against the real weight budget
+            'enableRateLimit': False,
             'options': {'defaultType': 'spot'}
         })
+        
+        # OHLCV memo: (symbol, timeframe, limit) -> (fetched_at, candles)
+        self._ohlcv_cache: Dict[tuple, tuple] = {}
+        self._ohlcv_inflight = SingleFlight()
+        
+        # Top pairs memo: limit -> (fetched_at, pairs)
+        self._top_pairs_cache: Dict[int, tuple] = {}
+        self._top_pairs_lock = asyncio.Lock()
+        
+        self.limiter = WeightLimiter()
+        
+        # Spot USDT symbols, built once markets are loaded
+        self._usdt_markets: Optional[frozenset] = None
+        
+        # Optional BinanceStream keeping hot series current (set at startup)
+        self.stream = None
+        
+        # Optional async Redis client sharing the OHLCV memo across workers (set at startup)
+        self.redis = None
+        
         logger.info("✅ Binance fetcher initialized")
     
+    async def warmup(self):
+        """Load market metadata up front (otherwise the first fetch loads it implicitly)"""
+        try:
+            await with_retry(self.exchange.load_markets)
+            self.limiter.sync(getattr(self.exchange, 'last_response_headers', None))
+            self._get_usdt_markets({})
+            logger.info(f"✅ Binance markets loaded ({len(self.exchange.symbols)} symbols)")
+        except Exception as e:
+            logger.warning(f"⚠️  Binance warmup failed, markets will load on first call: {e}")
+    
+    async def _weighted(self, weight: int, method, *args, **kwargs):
+        """Spend `weight` from the limiter, call the exchange, then re-sync from headers"""
+        await self.limiter.acquire(weight)
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            self.limiter.sync(getattr(self.exchange, 'last_response_headers', None))
+    
     async def get_top_pairs(self, limit: int = 30) -> List[str]:
         """
-        Get top N crypto pairs by 24h volume
+        Get top N crypto pairs by 24h volume (ranking reused for TOP_PAIRS_TTL seconds)
         Returns: ['BTC/USDT', 'ETH/USDT', ...]
         """
+        cached = self._top_pairs_cache.get(limit)
+        if cached and time.monotonic() - cached[0] < TOP_PAIRS_TTL:
+            return list(cached[1])
+        
+        # fetch_tickers is Binance's heaviest call - one at a time, bursts share it
+        async with self._top_pairs_lock:
+            cached = self._top_pairs_cache.get(limit)
+            if cached and time.monotonic() - cached[0] < TOP_PAIRS_TTL:
+                return list(cached[1])
+            
+            top_pairs = await self._fetch_top_pairs(limit)
+            if top_pairs is not None:
+                self._top_pairs_cache[limit] = (time.monotonic(), top_pairs)
+                return list(top_pairs)
+        
+        # Fallback to hardcoded top coins
+        return list(FALLBACK_TOP_PAIRS[:limit])
+    
+    async def _fetch_top_pairs(self, limit: int) -> Optional[List[str]]:
+        """Rank USDT pairs by 24h quote volume from live tickers (None if Binance fails)"""
         try:
             # Fetch all tickers
-            tickers = await asyncio.to_thread(self.exchange.fetch_tickers)
-            
-            # Filter USDT pairs only
-            usdt_pairs = {
-                symbol: ticker for symbol, ticker in tickers.items()
-                if '/USDT' in symbol and ticker.get('quoteVolume')
-            }
-            
-            # Sort by 24h volume (descending)
-            sorted_pairs = sorted(
-                usdt_pairs.items(),
-                key=lambda x: x[1]['quoteVolume'],
-                reverse=True
-            )
+            tickers = await with_retry(lambda: self._weighted(WEIGHT_TICKERS, self.exchange.fetch_tickers))
             
-            # Get top N
-            top_pairs = [pair[0] for pair in sorted_pairs[:limit]]
+            # ~2000 tickers to filter and rank - keep that CPU pass off the event loop
+            top_pairs = await asyncio.to_thread(self._rank_top, tickers, limit)
             
             logger.info(f"📊 Top {limit} pairs by volume: {top_pairs[:5]}...")
             return top_pairs
             
-        except Exception as e:
+        except ccxt.BaseError as e:
+            # Exchange/network failure -> caller falls back to the hardcoded list
+            # (anything else is a bug and should surface, not be masked by the fallback)
             logger.error(f"❌ Error fetching top pairs: {e}")
-            # Fallback to hardcoded top coins
-            return [
-                'BTC/USDT', 'ETH/USDT', 'BNB/USDT', 'SOL/USDT', 'XRP/USDT',
-                'ADA/USDT', 'DOGE/USDT', 'AVAX/USDT', 'DOT/USDT', 'MATIC/USDT',
-                'LINK/USDT', 'UNI/USDT', 'ATOM/USDT', 'LTC/USDT', 'NEAR/USDT',
-                'ALGO/USDT', 'FIL/USDT', 'APT/USDT', 'ARB/USDT', 'OP/USDT',
-                'ICP/USDT', 'VET/USDT', 'HBAR/USDT', 'GRT/USDT', 'AAVE/USDT',
-                'EOS/USDT', 'FTM/USDT', 'SAND/USDT', 'MANA/USDT', 'AXS/USDT'
-            ][:limit]
+            return None
+    
+    def _rank_top(self, tickers: Dict, limit: int) -> List[str]:
+        """Top N USDT pairs by 24h quote volume (descending)"""
+        # USDT pairs with volume, streamed as (symbol, 24h quote volume)
+        usdt_symbols = self._get_usdt_markets(tickers) & tickers.keys()
+        candidates = (
+            (symbol, tickers[symbol]['quoteVolume']) for symbol in usdt_symbols
+            if tickers[symbol].get('quoteVolume')
+        )
+        
+        # Partial heap select, no full sort
+        return [symbol for symbol, _ in heapq.nlargest(limit, candidates, key=itemgetter(1))]
+    
+    def _get_usdt_markets(self, tickers: Dict) -> frozenset:
+        """USDT-quoted symbols, built once from loaded markets (tickers as a fallback)"""
+        if self._usdt_markets is None:
+            if not self.exchange.symbols:
+                return frozenset(s for s in tickers if s.endswith('/USDT'))
+            self._usdt_markets = frozenset(s for s in self.exchange.symbols if s.endswith('/USDT'))
+        return self._usdt_markets
+    
+    async def fetch_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Last price for several symbols in one /ticker/24hr call
+        Returns: {'BTC/USDT': 43250.5, ...} (symbols Binance doesn't list are omitted)
+        """
+        try:
+            if not self.exchange.markets:
+                await with_retry(self.exchange.load_markets)
+            
+            # One unknown symbol would fail the whole batch
+            listed = [s for s in symbols if s in self.exchange.markets]
+            if not listed:
+                return {}
+            
+            tickers = await with_retry(
+                lambda: self._weighted(ticker_batch_weight(len(listed)), self.exchange.fetch_tickers, listed)
+            )
+            return {
+                symbol: ticker['last'] for symbol, ticker in tickers.items()
+                if ticker.get('last')
+            }
+        except Exception as e:
+            logger.error(f"❌ Error fetching prices for {len(symbols)} symbols: {e}")
+            return {}
     
     async def fetch_ohlcv(
         self,
@@ -68,23 +247,188 @@ class BinanceFetcher:
         limit: int = 300
     ) -> Optional[List[List]]:
         """
-        Fetch OHLCV candles
+        Fetch OHLCV candles (memoized for OHLCV_TTL seconds)
         Returns: [[timestamp, open, high, low, close, volume], ...]
         """
+        ttl = OHLCV_TTL.get(timeframe, 0)
+        if not ttl:
+            return await self._fetch_ohlcv_remote(symbol, timeframe, limit)
+        
+        key = (symbol, timeframe, limit)
+        cached = self._ohlcv_cache.get(key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        
+        # One fetch per key - concurrent misses wait and reuse the result
+        return await self._ohlcv_inflight.do(key, lambda: self._fetch_ohlcv_shared(key, ttl))
+    
+    async def _fetch_ohlcv_shared(self, key: tuple, ttl: int) -> Optional[List[List]]:
+        """Redis memo, then Binance - memoized in-process for `ttl` seconds"""
+        # Another worker may have fetched it already
+        ohlcv = await self._redis_get(key)
+        if ohlcv is None:
+            ohlcv = await self._fetch_ohlcv_remote(*key)
+            if ohlcv:
+                await self._redis_set(key, ohlcv, ttl)
+        
+        if ohlcv:
+            self._ohlcv_cache[key] = (time.monotonic(), ohlcv)
+        return ohlcv
+    
+    async def _redis_get(self, key: tuple) -> Optional[List[List]]:
+        """Candles from the shared Redis memo (None on miss, error or no Redis)"""
+        if self.redis is None:
+            return None
         try:
-            ohlcv = await asyncio.to_thread(
-                self.exchange.fetch_ohlcv,
-                symbol,
-                timeframe,
-                limit=limit
-            )
-            logger.info(f"✅ Fetched {len(ohlcv)} candles for {symbol} {timeframe}")
+            raw = await self.redis.get("ohlcv:%s:%s:%d" % key)
+            return orjson.loads(raw) if raw else None
+        except Exception as e:
+            logger.warning(f"⚠️  Redis read failed for {key}: {e}")
+            return None
+    
+    async def _redis_set(self, key: tuple, ohlcv: List[List], ttl: int):
+        """Share candles with other workers for `ttl` seconds"""
+        if self.redis is None:
+            return
+        try:
+            await self.redis.setex("ohlcv:%s:%s:%d" % key, ttl, orjson.dumps(ohlcv))
+        except Exception as e:
+            logger.warning(f"⚠️  Redis write failed for {key}: {e}")
+    
+    async def _fetch_ohlcv_remote(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int
+    ) -> Optional[List[List]]:
+        """Fetch OHLCV candles from Binance, downloading only what the disk cache lacks"""
+        try:
+            cached = await self._load_cached(symbol, timeframe, limit)
+            
+            # Kline stream keeps this series current - no REST call needed
+            streamed = self._from_stream(symbol, timeframe, limit, cached)
+            if streamed:
+                return streamed
+            
+            since = self._incremental_since(cached, timeframe, limit)
+            
+            if since is None:
+                ohlcv = await with_retry(
+                    lambda: self._weighted(WEIGHT_OHLCV, self.exchange.fetch_ohlcv, symbol, timeframe, limit=limit)
+                )
+                fresh = ohlcv
+            else:
+                # Re-fetch from the last cached candle (the overlap keeps the join gap-free)
+                fresh = await with_retry(
+                    lambda: self._weighted(
+                        WEIGHT_OHLCV, self.exchange.fetch_ohlcv, symbol, timeframe, since=since, limit=limit
+                    )
+                )
+                ohlcv = ([c for c in cached if c[0] < since] + fresh)[-limit:]
+            
+            await self._store_cached(symbol, timeframe, limit, fresh)
+            
+            logger.info(f"✅ Fetched {len(ohlcv)} candles for {symbol} {timeframe} ({len(fresh)} downloaded)")
             return ohlcv
             
+        except ccxt.BadSymbol:
+            # Caller error, not an outage - nothing to retry or log as a failure
+            logger.warning(f"⚠️  {symbol} is not listed on Binance")
+            return None
         except Exception as e:
             logger.error(f"❌ Error fetching {symbol} {timeframe}: {e}")
             return None
     
+    def _from_stream(self, symbol: str, timeframe: str, limit: int, cached: List[List]) -> Optional[List[List]]:
+        """Cached closed candles + the streamed open candle, if they join up without a gap"""
+        live = self.stream.live_candle(symbol, timeframe) if self.stream else None
+        if not live:
+            return None
+        
+        if limit == 1:
+            return [list(live)]
+        
+        closed = [c for c in cached if c[0] < live[0]]
+        if len(closed) < limit - 1:
+            return None
+        
+        # A close event missed while reconnecting leaves a hole - fall back to REST
+        window = closed[len(closed) - (limit - 1):]
+        tf_ms = self.exchange.parse_timeframe(timeframe) * 1000
+        if window[-1][0] + tf_ms != live[0] or window[-1][0] - window[0][0] != (limit - 2) * tf_ms:
+            return None
+        return window + [list(live)]
+    
+    def _incremental_since(self, cached: List[List], timeframe: str, limit: int) -> Optional[int]:
+        """Timestamp to resume from, or None when a full download is needed"""
+        if len(cached) < limit:
+            return None
+        
+        # Holes (e.g. stream closes lost while reconnecting) would be spliced into the result
+        last_ts = cached[-1][0]
+        tf_ms = self.exchange.parse_timeframe(timeframe) * 1000
+        if last_ts - cached[0][0] != (len(cached) - 1) * tf_ms:
+            return None
+        
+        missing = (self.exchange.milliseconds() - last_ts) // tf_ms + 1
+        
+        # A since= request returns the oldest `limit` candles after it - too far behind to bridge
+        if missing >= limit:
+            return None
+        return last_ts
+    
+    async def _load_cached(self, symbol: str, timeframe: str, limit: int) -> List[List]:
+        """Cached candles for the series (empty when disk cache is skipped or unavailable)"""
+        if limit < DISK_CACHE_MIN_LIMIT:
+            return []
+        try:
+            return await asyncio.to_thread(ohlcv_cache.load, symbol, timeframe, limit)
+        except Exception as e:
+            logger.warning(f"⚠️  OHLCV cache read failed for {symbol} {timeframe}: {e}")
+            return []
+    
+    async def _store_cached(self, symbol: str, timeframe: str, limit: int, ohlcv: List[List]):
+        """Persist downloaded closed candles (cache failures never fail the fetch)"""
+        if limit < DISK_CACHE_MIN_LIMIT or not ohlcv:
+            return
+        
+        # Only closed candles are cached - a partial row whose close event the stream
+        # missed would otherwise be served as history by _from_stream
+        tf_ms = self.exchange.parse_timeframe(timeframe) * 1000
+        now = self.exchange.milliseconds()
+        ohlcv = [c for c in ohlcv if c[0] + tf_ms <= now]
+        if not ohlcv:
+            return
+        try:
+            await asyncio.to_thread(ohlcv_cache.append, symbol, timeframe, ohlcv)
+        except Exception as e:
+            logger.warning(f"⚠️  OHLCV cache write failed for {symbol} {timeframe}: {e}")
+    
+    async def fetch_ohlcv_many(
+        self,
+        symbols: List[str],
+        timeframes: List[str],
+        limit: int = 300
+    ) -> Dict[str, Dict[str, List]]:
+        """
+        Fetch OHLCV for every symbol x timeframe, at most OHLCV_FANOUT in flight
+        Returns: {'BTC/USDT': {'15m': [...], '1h': [...]}, ...} (failed fetches omitted)
+        """
+        semaphore = asyncio.Semaphore(OHLCV_FANOUT)
+        
+        async def fetch_one(symbol: str, tf: str) -> Optional[List[List]]:
+            async with semaphore:
+                return await self.fetch_ohlcv(symbol, tf, limit)
+        
+        jobs = [(symbol, tf) for symbol in symbols for tf in timeframes]
+        results = await asyncio.gather(*(fetch_one(symbol, tf) for symbol, tf in jobs))
+        
+        grouped = {symbol: {} for symbol in symbols}
+        for (symbol, tf), ohlcv in zip(jobs, results):
+            if ohlcv:
+                grouped[symbol][tf] = ohlcv
+        return grouped
+    
     async def fetch_multi_timeframe(
         self,
         symbol: str,
@@ -94,12 +438,33 @@ class BinanceFetcher:
         Fetch OHLCV for multiple timeframes
         Returns: {'15m': [...], '1h': [...], '4h': [...]}
         """
-        results = {}
-        
-        for tf in timeframes:
-            ohlcv = await self.fetch_ohlcv(symbol, tf, limit=300)
-            if ohlcv:
-                results[tf] = ohlcv
+        # All timeframes in flight at once - one failure doesn't cancel the rest
+        results = await asyncio.gather(
+            *(self.fetch_ohlcv(symbol, tf, limit=300) for tf in timeframes),
+            return_exceptions=True
+        )
         
-        return results
+        return {
+            tf: ohlcv for tf, ohlcv in zip(timeframes, results)
+            if ohlcv and not isinstance(ohlcv, Exception)
+        }
+    
+    async def close(self):
+        """Close the exchange HTTP session (call on shutdown)"""
+        try:
+            await self.exchange.close()
+            logger.info("✅ Binance session closed")
+        except Exception as e:
+            logger.error(f"❌ Error closing Binance session: {e}")
+
+
+# Global instance (one ccxt client, connection pool and weight budget app-wide)
+binance_fetcher: Optional[BinanceFetcher] = None
+
 
+def get_binance_fetcher() -> BinanceFetcher:
+    """Get the shared fetcher, creating it on first use with the configured credentials"""
+    global binance_fetcher
+    if binance_fetcher is None:
+        binance_fetcher = BinanceFetcher(settings.BINANCE_API_KEY, settings.BINANCE_SECRET)
+    return binance_fetcher
@@ -0,0 +1,222 @@
+"""
+Binance Kline Stream
+Keeps OHLCV for the top pairs current over one WebSocket instead of REST polling
+"""
+import logging
+import asyncio
+import time
+from typing import List, Dict, Optional, Set
+import aiohttp
+from .ohlcv_cache import ohlcv_cache
+
+logger = logging.getLogger(__name__)
+
+STREAM_URL = "wss://stream.binance.com:9443/stream?streams="
+
+# Timeframes streamed per pair (the ones the scanners analyze)
+STREAM_TIMEFRAMES = ('15m', '1h', '4h')
+
+# A live candle older than this (seconds) is treated as stale - fall back to REST
+STREAM_STALE_AFTER = 60
+
+# Reconnect with a fresh top-pairs list this often (seconds)
+STREAM_RESUBSCRIBE = 3600
+
+# Kline events buffered per WebSocket client before the oldest is dropped
+SUBSCRIBER_QUEUE_SIZE = 100
+
+# Series streamed only because clients asked for them (outside the top-pairs set)
+MAX_CLIENT_SERIES = 20
+
+# Binance drops connections sending more than 5 messages per second
+SUBSCRIPTION_INTERVAL = 0.25
+
+# Reconnect backoff bounds (seconds)
+RECONNECT_BASE = 1
+RECONNECT_CAP = 60
+
+
+class BinanceStream:
+    """
+    Subscribes to <pair>@kline_<tf> for the top pairs (plus up to MAX_CLIENT_SERIES others clients ask for)
+    Closed candles go to the disk cache, the open candle is kept in memory,
+    and every event is fanned out to subscribed client queues
+    """
+    
+    def __init__(self, fetcher, top_n: int = 15, timeframes=STREAM_TIMEFRAMES):
+        self.fetcher = fetcher
+        self.top_n = top_n
+        self.timeframes = tuple(timeframes)
+        
+        # (symbol, timeframe) -> (received_at, open candle)
+        self._live: Dict[tuple, tuple] = {}
+        self._task: Optional[asyncio.Task] = None
+        
+        # 'BTCUSDT' -> 'BTC/USDT' for everything on the current connection
+        self._by_market_id: Dict[str, str] = {}
+        self._ws = None
+        self._request_id = 0
+        
+        # (symbol, timeframe) -> client queues, and the current top-pairs series
+        self._subscribers: Dict[tuple, Set[asyncio.Queue]] = {}
+        self._streamed: Set[tuple] = set()
+        
+        # Paces (UN)SUBSCRIBE messages under Binance's per-connection message limit
+        self._send_lock = asyncio.Lock()
+        self._last_sent = 0.0
+    
+    def start(self):
+        """Start the stream in the background"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info("✅ Binance kline stream started")
+    
+    async def stop(self):
+        """Stop the stream (call on shutdown)"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._live.clear()
+    
+    def live_candle(self, symbol: str, timeframe: str) -> Optional[List]:
+        """Latest (possibly still open) candle if the stream is current, else None"""
+        entry = self._live.get((symbol, timeframe))
+        if entry and time.monotonic() - entry[0] < STREAM_STALE_AFTER:
+            return entry[1]
+        return None
+    
+    def _client_series(self) -> Set[tuple]:
+        """Subscribed series outside the top-pairs set"""
+        return set(self._subscribers) - self._streamed
+    
+    async def subscribe(self, symbol: str, timeframe: str) -> Optional[asyncio.Queue]:
+        """
+        Queue receiving (candle, closed) for every kline event of the series
+        None when it would need a new client-only series beyond MAX_CLIENT_SERIES
+        """
+        key = (symbol, timeframe)
+        new_series = key not in self._streamed and key not in self._subscribers
+        if new_series and len(self._client_series()) >= MAX_CLIENT_SERIES:
+            return None
+        
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.setdefault(key, set()).add(queue)
+        
+        # Not streamed yet - add it to the live connection
+        if new_series:
+            self._by_market_id[symbol.replace('/', '')] = symbol
+            await self._send_subscription("SUBSCRIBE", key)
+        return queue
+    
+    async def unsubscribe(self, symbol: str, timeframe: str, queue: asyncio.Queue):
+        """Drop a client queue (and the upstream stream once nobody needs it)"""
+        key = (symbol, timeframe)
+        queues = self._subscribers.get(key)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if queues:
+            return
+        
+        del self._subscribers[key]
+        if key not in self._streamed:
+            await self._send_subscription("UNSUBSCRIBE", key)
+    
+    async def _send_subscription(self, method: str, key: tuple):
+        """(UN)SUBSCRIBE one stream on the open connection (next reconnect picks it up otherwise)"""
+        if self._ws is None or self._ws.closed:
+            return
+        symbol, timeframe = key
+        async with self._send_lock:
+            wait = self._last_sent + SUBSCRIPTION_INTERVAL - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            
+            ws = self._ws
+            if ws is None or ws.closed:
+                return
+            self._request_id += 1
+            try:
+                await ws.send_json({
+                    "method": method,
+                    "params": [f"{symbol.replace('/', '').lower()}@kline_{timeframe}"],
+                    "id": self._request_id
+                })
+            except Exception as e:
+                logger.warning(f"⚠️  Binance stream {method} failed for {symbol} {timeframe}: {e}")
+            self._last_sent = time.monotonic()
+    
+    async def _run(self):
+        """Connect, consume and reconnect with backoff until cancelled"""
+        attempt = 0
+        while True:
+            try:
+                pairs = await self.fetcher.get_top_pairs(limit=self.top_n)
+                await self._consume(pairs)
+                attempt = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                delay = min(RECONNECT_CAP, RECONNECT_BASE * (2 ** attempt))
+                attempt += 1
+                logger.warning(f"⚠️  Binance stream dropped ({e}), reconnecting in {delay}s")
+                await asyncio.sleep(delay)
+    
+    async def _consume(self, pairs: List[str]):
+        """Read one subscription session until STREAM_RESUBSCRIBE elapses"""
+        # Keep every series a client is still reading, even if it left the top pairs
+        self._streamed = {(pair, tf) for pair in pairs for tf in self.timeframes}
+        keys = self._streamed | set(self._subscribers)
+        
+        # 'BTC/USDT' <-> 'BTCUSDT' (stream names are lowercase, payloads uppercase)
+        self._by_market_id = {symbol.replace('/', ''): symbol for symbol, _ in keys}
+        streams = "/".join(
+            f"{symbol.replace('/', '').lower()}@kline_{tf}" for symbol, tf in keys
+        )
+        
+        deadline = time.monotonic() + STREAM_RESUBSCRIBE
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect(STREAM_URL + streams, heartbeat=30) as ws:
+                self._ws = ws
+                try:
+                    logger.info(f"📡 Streaming {len(pairs)} pairs x {len(self.timeframes)} timeframes (+{len(keys - self._streamed)} client series)")
+                    async for msg in ws:
+                        if msg.type != aiohttp.WSMsgType.TEXT:
+                            break
+                        await self._handle(msg.json())
+                        if time.monotonic() > deadline:
+                            return
+                finally:
+                    self._ws = None
+        
+        raise ConnectionError("stream closed by server")
+    
+    async def _handle(self, message: Dict):
+        """Record one kline event, fan it out, and persist it once the candle closes"""
+        k = message.get('data', {}).get('k')
+        if not k:
+            return
+        
+        symbol = self._by_market_id.get(k['s'])
+        if symbol is None:
+            return
+        
+        timeframe = k['i']
+        candle = [k['t'], float(k['o']), float(k['h']), float(k['l']), float(k['c']), float(k['v'])]
+        self._live[(symbol, timeframe)] = (time.monotonic(), candle)
+        
+        # Slow clients lose their oldest buffered event, never block the stream
+        for queue in self._subscribers.get((symbol, timeframe), ()):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait((candle, k['x']))
+        
+        if k['x']:
+            try:
+                await asyncio.to_thread(ohlcv_cache.append, symbol, timeframe, [candle])
+            except Exception as e:
+                logger.warning(f"⚠️  OHLCV cache write failed for {symbol} {timeframe}: {e}")
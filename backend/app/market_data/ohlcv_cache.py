@@ -0,0 +1,92 @@
+"""
+OHLCV Disk Cache
+Persists exchange candles in SQLite so only new candles are downloaded
+"""
+import logging
+from typing import List
+from sqlalchemy.dialects.sqlite import insert
+from ..database.connection import SessionLocal
+from ..database.models import OHLCVCandle
+
+logger = logging.getLogger(__name__)
+
+# Candles kept per (symbol, timeframe) - older rows are pruned on append
+MAX_CANDLES_PER_SERIES = 1000
+
+# Rows per INSERT (stays under SQLite's bound-parameter limit)
+INSERT_BATCH_SIZE = 100
+
+
+class OHLCVCache:
+    """Time-indexed candle store keyed by (symbol, timeframe, timestamp)"""
+    
+    def load(self, symbol: str, timeframe: str, limit: int) -> List[List]:
+        """
+        Latest `limit` cached candles, oldest first
+        Returns: [[timestamp, open, high, low, close, volume], ...]
+        """
+        db = SessionLocal()
+        try:
+            rows = db.query(
+                OHLCVCandle.timestamp,
+                OHLCVCandle.open,
+                OHLCVCandle.high,
+                OHLCVCandle.low,
+                OHLCVCandle.close,
+                OHLCVCandle.volume
+            ).filter(
+                OHLCVCandle.symbol == symbol,
+                OHLCVCandle.timeframe == timeframe
+            ).order_by(OHLCVCandle.timestamp.desc()).limit(limit).all()
+            
+            return [list(row) for row in reversed(rows)]
+        finally:
+            db.close()
+    
+    def append(self, symbol: str, timeframe: str, ohlcv: List[List]):
+        """Upsert closed candles (re-downloads overwrite) and prune old rows"""
+        if not ohlcv:
+            return
+        
+        db = SessionLocal()
+        try:
+            for start in range(0, len(ohlcv), INSERT_BATCH_SIZE):
+                stmt = insert(OHLCVCandle).values([
+                    {
+                        'symbol': symbol,
+                        'timeframe': timeframe,
+                        'timestamp': int(c[0]),
+                        'open': c[1],
+                        'high': c[2],
+                        'low': c[3],
+                        'close': c[4],
+                        'volume': c[5]
+                    }
+                    for c in ohlcv[start:start + INSERT_BATCH_SIZE]
+                ])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=['symbol', 'timeframe', 'timestamp'],
+                    set_={col: stmt.excluded[col] for col in ('open', 'high', 'low', 'close', 'volume')}
+                )
+                db.execute(stmt)
+            
+            # Drop everything older than the newest MAX_CANDLES_PER_SERIES candles
+            series = (OHLCVCandle.symbol == symbol, OHLCVCandle.timeframe == timeframe)
+            cutoff = db.query(OHLCVCandle.timestamp).filter(*series).order_by(
+                OHLCVCandle.timestamp.desc()
+            ).offset(MAX_CANDLES_PER_SERIES - 1).limit(1).scalar()
+            if cutoff is not None:
+                db.query(OHLCVCandle).filter(
+                    *series, OHLCVCandle.timestamp < cutoff
+                ).delete(synchronize_session=False)
+            
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+# Global instance
+ohlcv_cache = OHLCVCache()
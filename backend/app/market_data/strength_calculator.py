@@ -3,11 +3,44 @@ Market Strength Calculator
 Calculates relative strength score for crypto pairs
 """
 import logging
-from typing import Dict, List, Optional
+import math
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Shared zero-length column for missing OHLCV data
+EMPTY_COLUMN = np.empty(0, dtype=np.float64)
+
+# Fewest candles any candle-based sub-score uses (RSI needs period + 1)
+MIN_CANDLES = 15
+
+# Returned when strength can't be computed
+NEUTRAL_STRENGTH = {
+    'strength_score': 50,
+    'strength_level': 'Neutral',
+    'volume_strength': 50,
+    'momentum_strength': 50,
+    'ranking_strength': 50,
+    'rsi': 50
+}
+
+# Ranking bands: (base score, last rank in band, points per rank above the limit)
+RANKING_BANDS = ((90, 5, 2), (80, 10, 1), (60, 20, 1), (40, 30, 2))
+RANKING_BAND_LIMITS = tuple(limit for _, limit, _ in RANKING_BANDS)
+
+# Strength levels by score, lower bounds ascending
+STRENGTH_LEVEL_BOUNDS = (30, 45, 65, 80)
+STRENGTH_LEVELS = ('Very Weak', 'Weak', 'Neutral', 'Strong', 'Very Strong')
+
+
+def clamp_score(value: float, neutral: float = 50) -> float:
+    """Clamp to 0-100; NaN/inf (bad candles, zero prices) fall back to neutral"""
+    if not math.isfinite(value):
+        return neutral
+    return min(100, max(0, value))
+
 
 class MarketStrengthCalculator:
     """Calculate market strength score (0-100) for crypto pairs"""
@@ -49,8 +82,11 @@ class MarketStrengthCalculator:
         try:
             scores = []
             
+            # Columnar view of the candles, built once and shared by all helpers
+            closes, volumes = self._ohlcv_to_soa(ohlcv_data)
+            
             # 1. Volume Strength (25% weight)
-            volume_score = self._calculate_volume_strength(volume_24h, ohlcv_data)
+            volume_score = self._calculate_volume_strength(volume_24h, volumes)
             scores.append(volume_score * 0.25)
             
             # 2. Momentum Strength (30% weight)
@@ -65,13 +101,18 @@ class MarketStrengthCalculator:
                 scores.append(50 * 0.20)  # Neutral if no ranking
             
             # 4. RSI Strength (25% weight)
-            rsi = self._calculate_rsi(ohlcv_data)
+            rsi = self._calculate_rsi(closes)
             rsi_score = self._normalize_rsi_to_strength(rsi)
             scores.append(rsi_score * 0.25)
             
             # Calculate final score
             final_score = sum(scores)
             
+            # NaN compares false everywhere, so bisect would rank it 'Very Strong'
+            if not math.isfinite(final_score):
+                logger.warning(f"⚠️  {symbol} strength is not finite - using neutral")
+                return dict(NEUTRAL_STRENGTH)
+            
             # Determine level
             strength_level = self._get_strength_level(final_score)
             
@@ -90,24 +131,25 @@ class MarketStrengthCalculator:
             
         except Exception as e:
             logger.error(f"❌ Strength calculation error for {symbol}: {e}")
-            return {
-                'strength_score': 50,
-                'strength_level': 'Neutral',
-                'volume_strength': 50,
-                'momentum_strength': 50,
-                'ranking_strength': 50,
-                'rsi': 50
-            }
+            return dict(NEUTRAL_STRENGTH)
     
-    def _calculate_volume_strength(self, volume_24h: float, ohlcv_data: List[List]) -> float:
+    def _ohlcv_to_soa(self, ohlcv_data: List[List]) -> Tuple[np.ndarray, np.ndarray]:
+        """Convert OHLCV rows to (closes, volumes) float64 column arrays"""
+        # Too short for RSI/volume - skip the array build, both score neutral
+        if ohlcv_data is None or len(ohlcv_data) < MIN_CANDLES:
+            return EMPTY_COLUMN, EMPTY_COLUMN
+        
+        candles = np.asarray(ohlcv_data, dtype=np.float64)
+        return candles[:, 4], candles[:, 5]
+    
+    def _calculate_volume_strength(self, volume_24h: float, volumes: np.ndarray) -> float:
         """Calculate volume strength vs recent average"""
         try:
-            if not ohlcv_data or len(ohlcv_data) < 20:
+            if len(volumes) < 20:
                 return 50
             
-            # Get last 20 candles volumes
-            recent_volumes = [candle[5] for candle in ohlcv_data[-20:]]
-            avg_volume = np.mean(recent_volumes)
+            # Average of last 20 candles volumes
+            avg_volume = volumes[-20:].mean()
             
             if avg_volume == 0:
                 return 50
@@ -116,9 +158,7 @@ class MarketStrengthCalculator:
             volume_ratio = volume_24h / avg_volume
             
             # Map to 0-100 (ratio 0.5 = 0, ratio 1.0 = 50, ratio 2.0 = 100)
-            score = min(100, max(0, (volume_ratio - 0.5) * 100))
-            
-            return score
+            return clamp_score((volume_ratio - 0.5) * 100)
             
         except:
             return 50
@@ -128,9 +168,7 @@ class MarketStrengthCalculator:
         try:
             # Map -10% to +10% change to 0-100 scale
             # -10% = 0, 0% = 50, +10% = 100
-            score = 50 + (price_change_24h * 5)
-            
-            return min(100, max(0, score))
+            return clamp_score(50 + (price_change_24h * 5))
             
         except:
             return 50
@@ -143,32 +181,24 @@ class MarketStrengthCalculator:
             # 11-20: 60-80
             # 21-30: 40-60
             # 30+: 0-40
-            
-            if ranking <= 5:
-                return 90 + (5 - ranking) * 2
-            elif ranking <= 10:
-                return 80 + (10 - ranking)
-            elif ranking <= 20:
-                return 60 + (20 - ranking)
-            elif ranking <= 30:
-                return 40 + (30 - ranking) * 2
-            else:
+            band = bisect_left(RANKING_BAND_LIMITS, ranking)
+            if band == len(RANKING_BAND_LIMITS):
                 return max(0, 40 - (ranking - 30))
+            
+            base, limit, step = RANKING_BANDS[band]
+            return base + (limit - ranking) * step
                 
         except:
             return 50
     
-    def _calculate_rsi(self, ohlcv_data: List[List], period: int = 14) -> float:
-        """Calculate RSI from OHLCV data"""
+    def _calculate_rsi(self, closes: np.ndarray, period: int = 14) -> float:
+        """Calculate RSI from closing prices"""
         try:
-            if not ohlcv_data or len(ohlcv_data) < period + 1:
+            if len(closes) < period + 1:
                 return 50
             
-            # Get closing prices
-            closes = [candle[4] for candle in ohlcv_data[-period-1:]]
-            
             # Calculate price changes
-            deltas = np.diff(closes)
+            deltas = np.diff(closes[-period-1:])
             
             # Separate gains and losses
             gains = np.where(deltas > 0, deltas, 0)
@@ -185,7 +215,7 @@ class MarketStrengthCalculator:
             rs = avg_gain / avg_loss
             rsi = 100 - (100 / (1 + rs))
             
-            return rsi
+            return clamp_score(rsi)
             
         except:
             return 50
@@ -209,17 +239,7 @@ class MarketStrengthCalculator:
     
     def _get_strength_level(self, score: float) -> str:
         """Convert score to descriptive level"""
-        if score >= 80:
-            return 'Very Strong'
-        elif score >= 65:
-            return 'Strong'
-        elif score >= 45:
-            return 'Neutral'
-        elif score >= 30:
-            return 'Weak'
-        else:
-            return 'Very Weak'
-
+        return STRENGTH_LEVELS[bisect_right(STRENGTH_LEVEL_BOUNDS, score)]
 
 # Global instance
 strength_calculator = MarketStrengthCalculator()
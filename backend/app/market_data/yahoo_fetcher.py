@@ -5,9 +5,27 @@ import logging
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 import asyncio
+import yfinance as yf
+from types import MappingProxyType
+from ..metrics import stage_metrics
+from ..rate_limit import TokenBucket
+from ..single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Yahoo DataFrame columns in Binance OHLCV order (after the timestamp)
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# Downloads in flight, shared by every YahooFetcher, keyed (symbol, timeframe, limit)
+_inflight = SingleFlight()
+
+# Yahoo has no published quota - keep bursts short and the sustained rate modest
+YAHOO_BURST = 10
+YAHOO_REQUESTS_PER_MIN = 120
+
+# Token bucket shared by every YahooFetcher (one request = one token)
+_limiter = TokenBucket(capacity=YAHOO_BURST, refill_per_sec=YAHOO_REQUESTS_PER_MIN / 60)
+
 
 class YahooFetcher:
     """Fetches market data from Yahoo Finance"""
@@ -39,8 +57,22 @@ class YahooFetcher:
         'HSI': {'symbol': '^HSI', 'name': 'Hang Seng', 'emoji': '🇭🇰'},
     }
     
-    # Timeframe mapping (Yahoo format)
-    TIMEFRAME_MAP = {
+    # Symbol lists per market type, built once (read-only)
+    MARKET_SYMBOLS = MappingProxyType({
+        'commodities': tuple(v['symbol'] for v in COMMODITIES.values()),
+        'forex': tuple(v['symbol'] for v in FOREX.values()),
+        'indices': tuple(v['symbol'] for v in INDICES.values()),
+    })
+    
+    # Yahoo symbol -> info across all markets, for O(1) lookups (read-only)
+    SYMBOL_INFO = MappingProxyType({
+        info['symbol']: info
+        for market in (COMMODITIES, FOREX, INDICES)
+        for info in market.values()
+    })
+    
+    # Timeframe mapping (Yahoo format, read-only)
+    TIMEFRAME_MAP = MappingProxyType({
         '1m': '1m',
         '5m': '5m',
         '15m': '15m',
@@ -48,7 +80,7 @@ class YahooFetcher:
         '1h': '1h',
         '4h': '1h',  # Yahoo doesn't have 4h, we'll aggregate 1h data
         '1d': '1d',
-    }
+    })
     
     def __init__(self):
         logger.info("✅ YahooFetcher initialized")
@@ -60,14 +92,17 @@ class YahooFetcher:
         limit: int = 100
     ) -> Optional[List]:
         """
-        Fetch OHLCV data from Yahoo Finance
+        Fetch OHLCV data from Yahoo Finance (concurrent identical requests share one download)
         Returns data in Binance-compatible format: [[timestamp, open, high, low, close, volume], ...]
         """
+        return await _inflight.do(
+            (symbol, timeframe, limit),
+            lambda: self._fetch_ohlcv_remote(symbol, timeframe, limit)
+        )
+    
+    async def _fetch_ohlcv_remote(self, symbol: str, timeframe: str, limit: int) -> Optional[List]:
+        """Download and convert one symbol/timeframe from Yahoo Finance"""
         try:
-            # Import yfinance here to avoid issues if not installed
-            import yfinance as yf
-            import pandas as pd
-            
             logger.info(f"📊 Fetching {symbol} data from Yahoo Finance (TF: {timeframe})")
             
             # Get Yahoo timeframe
@@ -84,11 +119,13 @@ class YahooFetcher:
             
             # Fetch data
             ticker = yf.Ticker(symbol)
-            df = await asyncio.to_thread(
-                ticker.history,
-                period=f'{period_days}d',
-                interval=yahoo_tf
-            )
+            await _limiter.acquire(1)
+            with stage_metrics.timed('yahoo_fetch'):
+                df = await asyncio.to_thread(
+                    ticker.history,
+                    period=f'{period_days}d',
+                    interval=yahoo_tf
+                )
             
             if df.empty:
                 logger.warning(f"⚠️ No data returned for {symbol}")
@@ -101,34 +138,36 @@ class YahooFetcher:
             # Limit to requested number of candles
             df = df.tail(limit)
             
-            # Convert to Binance-compatible format
-            ohlcv = []
-            for idx, row in df.iterrows():
-                timestamp = int(idx.timestamp() * 1000)  # Convert to milliseconds
-                ohlcv.append([
-                    timestamp,
-                    float(row['Open']),
-                    float(row['High']),
-                    float(row['Low']),
-                    float(row['Close']),
-                    float(row['Volume'])
-                ])
+            # Convert to Binance-compatible format (columnar, no per-row Series)
+            timestamps = df.index.as_unit('ms').asi8.tolist()  # Epoch milliseconds
+            values = df[OHLCV_COLUMNS].to_numpy(dtype='float64').tolist()
+            ohlcv = [[ts, *row] for ts, row in zip(timestamps, values)]
             
             logger.info(f"✅ Fetched {len(ohlcv)} candles for {symbol}")
             return ohlcv
             
-        except ImportError:
-            logger.error("❌ yfinance not installed. Run: pip install yfinance")
-            return None
         except Exception as e:
             logger.error(f"❌ Error fetching {symbol} from Yahoo: {e}")
             return None
     
+    async def fetch_ohlcv_many(
+        self,
+        symbols: List[str],
+        timeframe: str = '4h',
+        limit: int = 100
+    ) -> Dict[str, Optional[List]]:
+        """
+        Fetch OHLCV for several symbols concurrently
+        Returns: {'GC=F': [[timestamp, open, high, low, close, volume], ...], ...}
+        """
+        results = await asyncio.gather(
+            *(self.fetch_ohlcv(symbol, timeframe, limit) for symbol in symbols)
+        )
+        return dict(zip(symbols, results))
+    
     def _aggregate_to_4h(self, df):
         """Aggregate 1h data to 4h candles"""
         try:
-            import pandas as pd
-            
             # Resample to 4h
             df_4h = df.resample('4h').agg({
                 'Open': 'first',
@@ -150,33 +189,22 @@ class YahooFetcher:
         """
         Get top symbols for a market type
         """
-        if market_type == 'commodities':
-            symbols = [v['symbol'] for v in self.COMMODITIES.values()]
-        elif market_type == 'forex':
-            symbols = [v['symbol'] for v in self.FOREX.values()]
-        elif market_type == 'indices':
-            symbols = [v['symbol'] for v in self.INDICES.values()]
-        else:
+        symbols = self.MARKET_SYMBOLS.get(market_type)
+        if symbols is None:
             logger.warning(f"⚠️ Unknown market type: {market_type}")
             return []
         
-        return symbols[:limit]
+        return list(symbols[:limit])
     
     def get_symbol_info(self, symbol: str) -> Optional[Dict]:
         """Get symbol information (name, emoji, etc.)"""
-        # Check in all markets
-        for market_dict in [self.COMMODITIES, self.FOREX, self.INDICES]:
-            for key, info in market_dict.items():
-                if info['symbol'] == symbol:
-                    return info
-        return None
+        return self.SYMBOL_INFO.get(symbol)
     
     async def get_current_price(self, symbol: str) -> Optional[float]:
         """Get current/latest price for a symbol"""
         try:
-            import yfinance as yf
-            
             ticker = yf.Ticker(symbol)
+            await _limiter.acquire(1)
             data = await asyncio.to_thread(ticker.history, period='1d', interval='1m')
             
             if data.empty:
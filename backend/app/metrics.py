@@ -0,0 +1,46 @@
+"""
+Pipeline Stage Metrics
+Lightweight per-stage wall-time accumulators (exposed at /api/metrics)
+"""
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict
+
+
+class StageMetrics:
+    """Accumulate call counts and elapsed nanoseconds per named stage"""
+    
+    def __init__(self):
+        self.total_ns = Counter()
+        self.calls = Counter()
+    
+    @contextmanager
+    def timed(self, stage: str):
+        """Time the wrapped block (awaits included) under `stage`"""
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.total_ns[stage] += time.perf_counter_ns() - start
+            self.calls[stage] += 1
+    
+    def snapshot(self) -> Dict[str, Dict]:
+        """Per-stage calls, total and average milliseconds"""
+        return {
+            stage: {
+                'calls': self.calls[stage],
+                'total_ms': round(total / 1e6, 2),
+                'avg_ms': round(total / 1e6 / self.calls[stage], 2)
+            }
+            for stage, total in self.total_ns.most_common()
+        }
+    
+    def reset(self):
+        """Clear all accumulated timings"""
+        self.total_ns.clear()
+        self.calls.clear()
+
+
+# Global instance
+stage_metrics = StageMetrics()
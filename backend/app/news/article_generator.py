@@ -2,14 +2,38 @@
 AI-Powered Article Generator
 """
 import logging
+import traceback
+import re
+import orjson
 from typing import List, Dict, Optional
 from datetime import datetime
-import anthropic
-from groq import Groq
 from ..config import settings
+from ..ai.claude_analyzer import get_anthropic_client
+from ..ai.groq_analyzer import get_groq_client
 
 logger = logging.getLogger(__name__)
 
+# AI response parsing
+JSON_BODY_RE = re.compile(r'\{[\s\S]*\}')
+JSON_FENCE_RE = re.compile(r'```json\s*|```\s*$')
+
+# HTML -> Telegram conversion: (pattern, replacement), applied in order
+TELEGRAM_HTML_RULES = tuple(
+    (re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in (
+        (r'<h[1-6][^>]*>(.*?)</h[1-6]>', r'\n\n<b>\1</b>\n'),  # Headings -> bold
+        (r'<p[^>]*>(.*?)</p>', r'\1\n\n'),                      # Paragraphs
+        (r'<ul[^>]*>|<ol[^>]*>', ''),                            # List openers
+        (r'</ul>|</ol>', '\n'),                                  # List closers
+        (r'<li[^>]*>(.*?)</li>', r'• \1\n'),                     # List items -> bullets
+        (r'<div[^>]*>', ''),
+        (r'</div>', '\n'),
+        (r'<br\s*/?>', '\n'),
+    )
+)
+MULTI_NEWLINE_RE = re.compile(r'\n{3,}')
+
+
 class ArticleGenerator:
     """Generate articles using AI from news sources"""
     
@@ -18,10 +42,10 @@ class ArticleGenerator:
         self.groq_client = None
         
         if settings.ANTHROPIC_API_KEY:
-            self.claude_client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+            self.claude_client = get_anthropic_client(settings.ANTHROPIC_API_KEY)
         
         if settings.GROQ_API_KEY:
-            self.groq_client = Groq(api_key=settings.GROQ_API_KEY)
+            self.groq_client = get_groq_client(settings.GROQ_API_KEY)
     
     def _build_prompt(
         self,
@@ -132,8 +156,8 @@ Genera SOLO il JSON ora (inizia con {{):"""
         try:
             prompt = self._build_prompt(articles, style, language, max_length)
             
-            # Synchronous call (Claude SDK doesn't require async)
-            response = self.claude_client.messages.create(
+            # Async client - doesn't block the event loop while Claude writes
+            response = await self.claude_client.messages.create(
                 model="claude-sonnet-4-20250514",
                 max_tokens=2000,
                 temperature=0.7,
@@ -148,8 +172,7 @@ Genera SOLO il JSON ora (inizia con {{):"""
             
         except Exception as e:
             logger.error(f"Error generating article with Claude: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(traceback.format_exc())
             return None
     
     async def generate_with_groq(
@@ -167,8 +190,8 @@ Genera SOLO il JSON ora (inizia con {{):"""
         try:
             prompt = self._build_prompt(articles, style, language, max_length)
             
-            # Synchronous call
-            response = self.groq_client.chat.completions.create(
+            # Async client - doesn't block the event loop while Groq writes
+            response = await self.groq_client.chat.completions.create(
                 model="llama-3.3-70b-versatile",
                 messages=[{
                     "role": "user",
@@ -183,8 +206,7 @@ Genera SOLO il JSON ora (inizia con {{):"""
             
         except Exception as e:
             logger.error(f"Error generating article with Groq: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(traceback.format_exc())
             return None
     
     async def generate(
@@ -217,28 +239,23 @@ Genera SOLO il JSON ora (inizia con {{):"""
         
         # Parse JSON from response (AI might add text before/after)
         try:
-            # Try to find JSON in the response
-            import re
-            import json
-            
             # Method 1: Find JSON object with regex
-            json_match = re.search(r'\{[\s\S]*\}', content)
+            json_match = JSON_BODY_RE.search(content)
             if json_match:
                 json_str = json_match.group(0)
                 try:
-                    article_data = json.loads(json_str)
+                    article_data = orjson.loads(json_str)
                     logger.info(f"✅ JSON parsed successfully")
-                except json.JSONDecodeError as e:
+                except orjson.JSONDecodeError as e:
                     logger.error(f"❌ JSON parse error: {e}")
                     logger.error(f"JSON string: {json_str[:500]}...")
                     
                     # Method 2: Try to fix common issues
                     # Remove markdown code blocks
-                    json_str = re.sub(r'```json\s*', '', json_str)
-                    json_str = re.sub(r'```\s*$', '', json_str)
+                    json_str = JSON_FENCE_RE.sub('', json_str)
                     
                     try:
-                        article_data = json.loads(json_str)
+                        article_data = orjson.loads(json_str)
                         logger.info(f"✅ JSON parsed after cleanup")
                     except:
                         logger.error(f"❌ Could not parse JSON even after cleanup")
@@ -284,8 +301,7 @@ Genera SOLO il JSON ora (inizia con {{):"""
             
         except Exception as e:
             logger.error(f"❌ Error parsing AI response: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(traceback.format_exc())
             logger.error(f"Raw response: {content[:1000]}...")
             return None
     
@@ -298,35 +314,13 @@ Genera SOLO il JSON ora (inizia con {{):"""
         # Telegram only supports: <b>, <strong>, <i>, <em>, <u>, <s>, <a>, <code>, <pre>
         # Remove unsupported tags: <p>, <h1>, <h2>, <h3>, <ul>, <ol>, <li>, <div>
         
-        import re
-        
-        # Replace headings with bold text + newlines
-        content = re.sub(r'<h[1-6][^>]*>(.*?)</h[1-6]>', r'\n\n<b>\1</b>\n', content, flags=re.IGNORECASE)
-        
-        # Replace paragraphs with double newlines
-        content = re.sub(r'<p[^>]*>(.*?)</p>', r'\1\n\n', content, flags=re.IGNORECASE)
-        
-        # Replace <ul> and <ol> lists
-        content = re.sub(r'<ul[^>]*>', '', content, flags=re.IGNORECASE)
-        content = re.sub(r'</ul>', '\n', content, flags=re.IGNORECASE)
-        content = re.sub(r'<ol[^>]*>', '', content, flags=re.IGNORECASE)
-        content = re.sub(r'</ol>', '\n', content, flags=re.IGNORECASE)
-        
-        # Replace list items with bullet points
-        content = re.sub(r'<li[^>]*>(.*?)</li>', r'• \1\n', content, flags=re.IGNORECASE)
-        
-        # Remove <div> tags
-        content = re.sub(r'<div[^>]*>', '', content, flags=re.IGNORECASE)
-        content = re.sub(r'</div>', '\n', content, flags=re.IGNORECASE)
-        
-        # Replace <br> with newline
-        content = re.sub(r'<br\s*/?>', '\n', content, flags=re.IGNORECASE)
-        
-        # Keep supported tags: <b>, <strong>, <i>, <em>, <u>, <s>, <code>, <pre>, <a>
-        # They should work as-is
+        # Rewrite unsupported tags (headings, paragraphs, lists, div, br)
+        # Supported tags: <b>, <strong>, <i>, <em>, <u>, <s>, <code>, <pre>, <a> work as-is
+        for pattern, replacement in TELEGRAM_HTML_RULES:
+            content = pattern.sub(replacement, content)
         
         # Clean up multiple newlines
-        content = re.sub(r'\n{3,}', '\n\n', content)
+        content = MULTI_NEWLINE_RE.sub('\n\n', content)
         content = content.strip()
         
         # Limit length for Telegram (4096 chars max)
@@ -344,7 +338,6 @@ Genera SOLO il JSON ora (inizia con {{):"""
             content += sources_text
         
         # Add metadata footer
-        from datetime import datetime
         footer = f"\n\n🤖 <i>Generated by AI"
         if article.get('ai_provider'):
             footer += f" ({article.get('ai_provider', 'AI').upper()})"
@@ -2,13 +2,30 @@
 RSS Feed Scraper for Financial News
 """
 import feedparser
+import aiohttp
 import logging
+import traceback
 import asyncio
+import time
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
+from ..single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Seconds a parsed feed is reused before it is fetched again
+FEED_CACHE_TTL = 300
+
+# Per-feed download timeout (seconds)
+FEED_TIMEOUT = 10.0
+
+# Feed downloads in flight at once (across categories)
+FEED_FANOUT = 8
+
+# Some feeds reject aiohttp's default User-Agent
+FEED_HEADERS = {'User-Agent': 'Mozilla/5.0 (compatible; TradingBot/1.0; RSS reader)'}
+
+
 class NewsFeedScraper:
     """Scrape news from RSS feeds"""
     
@@ -46,23 +63,73 @@ class NewsFeedScraper:
     }
     
     def __init__(self):
-        self.session = None
+        # Shared HTTP session (keep-alive pool across feeds), created on first fetch
+        self.session: Optional[aiohttp.ClientSession] = None
+        
+        # Parsed feed memo: url -> (fetched_at, articles)
+        self._feed_cache: Dict[str, tuple] = {}
+        
+        # Downloads in flight by URL (concurrent misses share one request)
+        self._inflight = SingleFlight(default=[])
+        
+        # Lowercased 'title\nsummary' per article (keyed by link/title) for keyword search
+        self._search_text: Dict[str, str] = {}
+        self._search_keys: Dict[str, List[str]] = {}
+        
+        # Caps concurrent downloads when categories are fetched together
+        self._fanout = asyncio.Semaphore(FEED_FANOUT)
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Shared session - must be created inside the running event loop"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                headers=FEED_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=FEED_TIMEOUT),
+                connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+            )
+        return self.session
+    
+    async def close(self):
+        """Close the shared HTTP session (call on shutdown)"""
+        if self.session and not self.session.closed:
+            await self.session.close()
     
     async def fetch_feed(self, feed_url: str) -> List[Dict]:
-        """Fetch and parse RSS feed"""
+        """Fetch and parse RSS feed (reused for FEED_CACHE_TTL seconds, one download per URL at a time)"""
+        cached = self._feed_cache.get(feed_url)
+        if cached and time.monotonic() - cached[0] < FEED_CACHE_TTL:
+            # Copies - callers tag articles with category/feed metadata
+            return [dict(article) for article in cached[1]]
+        
+        articles = await self._inflight.do(feed_url, lambda: self._refresh_feed(feed_url))
+        return [dict(article) for article in articles]
+    
+    async def _refresh_feed(self, feed_url: str) -> List[Dict]:
+        """Download the feed and memoize it when it has articles"""
+        articles = await self._fetch_feed_remote(feed_url)
+        if articles:
+            self._feed_cache[feed_url] = (time.monotonic(), articles)
+        return articles
+    
+    async def _fetch_feed_remote(self, feed_url: str) -> List[Dict]:
+        """Download and parse RSS feed"""
         try:
             logger.info(f"📡 Fetching RSS feed: {feed_url}")
             
-            # Run feedparser in thread pool with timeout (10 seconds)
+            # Download on the shared keep-alive session (10 second timeout)
             try:
-                feed = await asyncio.wait_for(
-                    asyncio.to_thread(feedparser.parse, feed_url),
-                    timeout=10.0
-                )
+                async with self._get_session().get(feed_url) as response:
+                    if response.status >= 400:
+                        logger.warning(f"⚠️ HTTP {response.status} from {feed_url}")
+                        return []
+                    content = await response.read()
             except asyncio.TimeoutError:
-                logger.error(f"⏱️ Timeout fetching {feed_url} (>10s)")
+                logger.error(f"⏱️ Timeout fetching {feed_url} (>{FEED_TIMEOUT:.0f}s)")
                 return []
             
+            # Parse the downloaded bytes in thread pool (no network in feedparser)
+            feed = await asyncio.to_thread(feedparser.parse, content)
+            
             if not feed:
                 logger.warning(f"⚠️ Empty response from {feed_url}")
                 return []
@@ -104,15 +171,36 @@ class NewsFeedScraper:
                     }
                     articles.append(article)
             
+            self._index_search_text(feed_url, articles)
+            
             logger.info(f"✅ Extracted {len(articles)} valid articles from {feed_title}")
             return articles
             
         except Exception as e:
             logger.error(f"❌ Error fetching feed {feed_url}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(traceback.format_exc())
             return []
     
+    @staticmethod
+    def _search_key(article: Dict) -> str:
+        return article.get('link') or article.get('title', '')
+    
+    @staticmethod
+    def _build_search_text(article: Dict) -> str:
+        return f"{article.get('title', '')}\n{article.get('summary', '')}".lower()
+    
+    def _index_search_text(self, feed_url: str, articles: List[Dict]):
+        """Lowercase each article once at fetch time (replaces the feed's previous entries)"""
+        for key in self._search_keys.pop(feed_url, ()):
+            self._search_text.pop(key, None)
+        
+        keys = []
+        for article in articles:
+            key = self._search_key(article)
+            self._search_text[key] = self._build_search_text(article)
+            keys.append(key)
+        self._search_keys[feed_url] = keys
+    
     async def fetch_category(self, category: str, max_articles: int = 20) -> List[Dict]:
         """Fetch articles from a category"""
         logger.info(f"📰 Fetching news for category: {category}")
@@ -125,17 +213,22 @@ class NewsFeedScraper:
         all_articles = []
         failed_feeds = []
         
-        # Fetch from all feeds in category
+        # Fetch all feeds in category concurrently
+        known = []
         for feed_name in feed_names:
             if feed_name not in self.FEEDS:
                 logger.warning(f"⚠️ Feed {feed_name} not found in FEEDS dict")
                 continue
-            
-            feed_url = self.FEEDS[feed_name]
-            logger.info(f"   📡 Fetching from {feed_name}...")
-            
-            articles = await self.fetch_feed(feed_url)
-            
+            known.append(feed_name)
+        
+        async def fetch_one(feed_name: str) -> List[Dict]:
+            async with self._fanout:
+                logger.info(f"   📡 Fetching from {feed_name}...")
+                return await self.fetch_feed(self.FEEDS[feed_name])
+        
+        results = await asyncio.gather(*(fetch_one(feed_name) for feed_name in known))
+        
+        for feed_name, articles in zip(known, results):
             if not articles:
                 failed_feeds.append(feed_name)
                 logger.warning(f"   ⚠️ No articles from {feed_name}")
@@ -178,11 +271,13 @@ class NewsFeedScraper:
         """Fetch all feeds, grouped by category"""
         cutoff_time = datetime.now() - timedelta(hours=hours_ago)
         
+        # All categories at once (downloads bounded by FEED_FANOUT)
+        categories = list(self.CATEGORIES.keys())
+        logger.info(f"📰 Fetching categories: {', '.join(categories)}")
+        fetched = await asyncio.gather(*(self.fetch_category(category) for category in categories))
+        
         result = {}
-        for category in self.CATEGORIES.keys():
-            logger.info(f"📰 Fetching category: {category}")
-            articles = await self.fetch_category(category)
-            
+        for category, articles in zip(categories, fetched):
             # Filter by time if published_parsed exists
             recent_articles = []
             for article in articles:
@@ -216,12 +311,12 @@ class NewsFeedScraper:
             for cat_articles in all_feeds.values():
                 articles.extend(cat_articles)
         
-        # Filter by keyword (case insensitive)
+        # Filter by keyword (case insensitive, against text lowercased at fetch time)
         keyword_lower = keyword.lower()
+        search_text = self._search_text
         matching = [
             a for a in articles
-            if keyword_lower in a.get('title', '').lower() 
-            or keyword_lower in a.get('summary', '').lower()
+            if keyword_lower in (search_text.get(self._search_key(a)) or self._build_search_text(a))
         ]
         
         logger.info(f"✅ Found {len(matching)} articles matching '{keyword}'")
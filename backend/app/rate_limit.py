@@ -0,0 +1,31 @@
+"""
+Token Bucket Rate Limiting
+Smooths outbound requests to an upstream API's budget
+"""
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Refills `refill_per_sec` tokens continuously up to `capacity`; callers wait for what they spend"""
+    
+    def __init__(self, capacity: float, refill_per_sec: float):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self.tokens = float(capacity)
+        self.last = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _drip(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.refill_per_sec)
+        self.last = now
+    
+    async def acquire(self, tokens: float = 1):
+        """Wait until `tokens` are available, then spend them"""
+        async with self._lock:
+            self._drip()
+            while self.tokens < tokens:
+                await asyncio.sleep((tokens - self.tokens) / self.refill_per_sec)
+                self._drip()
+            self.tokens -= tokens
@@ -0,0 +1,27 @@
+"""
+Optional Redis Cache
+Shared response and OHLCV cache across workers when REDIS_URL is set
+"""
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    from redis import asyncio as aioredis
+    from fastapi_cache.backends.redis import RedisBackend
+    REDIS_AVAILABLE = True
+except ImportError:
+    aioredis = None
+    RedisBackend = None
+    REDIS_AVAILABLE = False
+
+
+def create_redis(url: str) -> Optional["aioredis.Redis"]:
+    """Async Redis client for url, or None (not configured / redis not installed)"""
+    if not url:
+        return None
+    if not REDIS_AVAILABLE:
+        logger.warning("⚠️  REDIS_URL is set but redis is not installed - using in-memory cache")
+        return None
+    return aioredis.from_url(url)
@@ -10,7 +10,7 @@ from app.admin.system_controller import system_controller
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/admin", tags=["admin"])
+router = APIRouter(prefix="/admin", tags=["admin"])
 
 
 class SystemToggleResponse(BaseModel):
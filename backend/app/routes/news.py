@@ -2,11 +2,16 @@
 News/Articles API Routes
 """
 import logging
+import asyncio
+import traceback
+import feedparser
 from fastapi import APIRouter, Query, HTTPException
 from typing import List, Dict, Optional
 from ..news.feeds import news_scraper
 from ..news.article_generator import article_generator
 from ..database.tracker import trade_tracker
+from ..database.connection import SessionLocal
+from ..database.models import NewsArticle
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -26,9 +31,6 @@ def get_telegram():
 async def test_feeds():
     """Test RSS feed fetching - diagnostic endpoint"""
     try:
-        import feedparser
-        import asyncio
-        
         test_results = {}
         
         # Test simple feed
@@ -76,8 +78,7 @@ async def test_feeds():
         
     except Exception as e:
         logger.error(f"❌ Test error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error(traceback.format_exc())
         return {
             "success": False,
             "error": str(e),
@@ -104,7 +105,6 @@ async def test_single_feed():
         
     except Exception as e:
         logger.error(f"❌ Single feed test error: {e}")
-        import traceback
         return {
             "success": False,
             "error": str(e),
@@ -171,8 +171,7 @@ async def test_ai_generation():
             
     except Exception as e:
         logger.error(f"❌ Test AI error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error(traceback.format_exc())
         return {
             "success": False,
             "error": str(e),
@@ -305,9 +304,6 @@ async def generate_article(
         # Save to database if requested
         article_id = None
         if save_to_db:
-            from ..database.tracker import SessionLocal
-            from ..database.models import NewsArticle
-            
             db = SessionLocal()
             try:
                 # Extract title from content (first line usually)
@@ -333,8 +329,7 @@ async def generate_article(
                 logger.info(f"✅ Article saved to database with ID: {article_id}")
             except Exception as e:
                 logger.error(f"❌ Error saving article to DB: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.error(traceback.format_exc())
                 db.rollback()
             finally:
                 db.close()
@@ -349,8 +344,7 @@ async def generate_article(
         
     except Exception as e:
         logger.error(f"❌ Error generating article: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error(traceback.format_exc())
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -363,9 +357,6 @@ async def get_articles(
     offset: int = Query(0, description="Skip N results")
 ):
     """Get articles from database"""
-    from ..database.tracker import SessionLocal
-    from ..database.models import NewsArticle
-    
     db = SessionLocal()
     try:
         query = db.query(NewsArticle)
@@ -397,9 +388,6 @@ async def publish_article(
     topic: str = Query("news_articles", description="Telegram topic: news_articles, education, general")
 ):
     """Publish article to Telegram"""
-    from ..database.tracker import SessionLocal
-    from ..database.models import NewsArticle
-    
     telegram = get_telegram()
     
     if not telegram or not telegram.is_available():
@@ -457,9 +445,6 @@ async def publish_article(
 @router.delete("/articles/{article_id}")
 async def delete_article(article_id: int):
     """Delete an article"""
-    from ..database.tracker import SessionLocal
-    from ..database.models import NewsArticle
-    
     db = SessionLocal()
     try:
         article = db.query(NewsArticle).filter(NewsArticle.id == article_id).first()
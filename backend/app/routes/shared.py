@@ -0,0 +1,32 @@
+"""
+Shared service accessors for API routes
+"""
+import logging
+from ..config import settings
+from ..scanner.scanner import TradingScanner
+
+logger = logging.getLogger(__name__)
+
+# Only built if the app-wide scanner isn't available (e.g. lifespan not run)
+_fallback_scanner = None
+
+
+def get_scanner() -> TradingScanner:
+    """Get the app-wide scanner (shared AI clients and caches) from main module"""
+    global _fallback_scanner
+    
+    try:
+        from .. import main
+        if main.scanner:
+            return main.scanner
+    except ImportError:
+        pass
+    
+    if _fallback_scanner is None:
+        logger.warning("⚠️  App scanner not initialized, creating fallback scanner")
+        _fallback_scanner = TradingScanner(
+            claude_key=settings.ANTHROPIC_API_KEY,
+            groq_key=settings.GROQ_API_KEY,
+            min_confidence=settings.MIN_CONFIDENCE_SCORE
+        )
+    return _fallback_scanner
@@ -2,8 +2,14 @@
 API routes for Stocks scanning with custom selection
 """
 import logging
+import asyncio
+import traceback
 from fastapi import APIRouter, Query, Body
 from typing import List, Dict
+from .shared import get_scanner
+from ..config import settings
+from ..database.tracker import TradeTracker
+from ..market_data.yahoo_fetcher import YahooFetcher
 
 logger = logging.getLogger(__name__)
 
@@ -165,11 +171,6 @@ async def scan_stocks(
         if not timeframes:
             return {"success": False, "error": "No timeframes selected"}
         
-        from ..market_data.yahoo_fetcher import YahooFetcher
-        from ..scanner.scanner import TradingScanner
-        from ..config import settings
-        from ..database.tracker import TradeTracker
-        
         logger.info(f"📈 Starting STOCKS scan for {len(selected_symbols)} stocks with {ai_provider.upper()} AI...")
         logger.info(f"   Symbols: {', '.join(selected_symbols)}")
         logger.info(f"   Timeframes: {', '.join(timeframes)}")
@@ -177,25 +178,13 @@ async def scan_stocks(
         # Initialize fetcher
         yahoo_fetcher = YahooFetcher()
         
-        # Initialize scanner with Yahoo fetcher
-        scanner = TradingScanner(
-            binance_key="",
-            binance_secret="",
-            claude_key=settings.ANTHROPIC_API_KEY,
-            groq_key=settings.GROQ_API_KEY,
-            top_n_coins=len(selected_symbols),
-            min_confidence=settings.MIN_CONFIDENCE_SCORE
-        )
-        
-        # Set AI provider
-        scanner.set_ai_provider(ai_provider)
-        
-        # Replace Binance fetcher with Yahoo fetcher
-        scanner.fetcher = yahoo_fetcher
+        # Shared scanner - reuses the app's AI clients
+        scanner = get_scanner()
         
-        # Create scan session in database
+        # Create scan session in database (SQLite I/O off the event loop)
         trade_tracker = TradeTracker()
-        scan_id = trade_tracker.create_scan_session(
+        scan_id = await asyncio.to_thread(
+            trade_tracker.create_scan_session,
             scan_type='manual_stocks',
             top_n=len(selected_symbols),
             timeframes=timeframes,
@@ -205,6 +194,9 @@ async def scan_stocks(
         # Scan each stock on each timeframe
         all_setups = []
         for timeframe in timeframes:
+            # Fetch all symbols for this timeframe concurrently
+            candles_by_symbol = await yahoo_fetcher.fetch_ohlcv_many(selected_symbols, timeframe, limit=100)
+            
             for symbol in selected_symbols:
                 try:
                     # Get stock info (name)
@@ -213,8 +205,8 @@ async def scan_stocks(
                     
                     logger.info(f"   Analyzing {display_name} ({symbol}) on {timeframe}...")
                     
-                    # Fetch OHLCV data
-                    ohlcv = await yahoo_fetcher.fetch_ohlcv(symbol, timeframe, limit=100)
+                    # OHLCV data (prefetched above)
+                    ohlcv = candles_by_symbol.get(symbol)
                     
                     if not ohlcv or len(ohlcv) < 50:
                         logger.warning(f"   ⚠️ Insufficient data for {symbol}")
@@ -224,10 +216,7 @@ async def scan_stocks(
                     current_price = ohlcv[-1][4]
                     
                     # Get AI analysis
-                    if ai_provider == 'claude':
-                        analysis = await scanner.claude.analyze_setup(display_name, ohlcv, timeframe)
-                    else:
-                        analysis = await scanner.groq.analyze_setup(display_name, ohlcv, timeframe)
+                    analysis = await scanner.analyze_cached(display_name, ohlcv, timeframe, provider=ai_provider)
                     
                     if not analysis:
                         logger.warning(f"   ⚠️ No analysis returned for {symbol}")
@@ -263,7 +252,7 @@ async def scan_stocks(
                     logger.info(f"   ✅ {display_name} ({timeframe}): {setup['direction']} @ {confidence}%")
                     
                     # Save to database
-                    trade_tracker.save_setup(setup, scan_id=scan_id)
+                    await asyncio.to_thread(trade_tracker.save_setup, setup, scan_id=scan_id)
                     
                 except Exception as e:
                     logger.error(f"   ❌ Error analyzing {symbol}: {e}")
@@ -276,7 +265,8 @@ async def scan_stocks(
         
         # Complete scan session
         high_conf_count = len([s for s in all_setups if s.get('confidence', 0) >= settings.MIN_CONFIDENCE_SCORE])
-        trade_tracker.complete_scan_session(
+        await asyncio.to_thread(
+            trade_tracker.complete_scan_session,
             scan_id=scan_id,
             setups_count=len(all_setups),
             high_confidence_count=high_conf_count
@@ -294,7 +284,6 @@ async def scan_stocks(
         
     except Exception as e:
         logger.error(f"❌ Stocks scan error: {e}")
-        import traceback
         logger.error(traceback.format_exc())
         return {"success": False, "error": str(e)}
 
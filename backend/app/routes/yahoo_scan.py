@@ -0,0 +1,175 @@
+"""
+Shared manual scan for Yahoo Finance markets (commodities, indices)
+"""
+import logging
+import asyncio
+import traceback
+from typing import Dict
+from .shared import get_scanner
+from ..config import settings
+from ..database.tracker import TradeTracker
+from ..market_data.yahoo_fetcher import YahooFetcher
+from ..telegram.bot import TelegramNotifier
+
+logger = logging.getLogger(__name__)
+
+# Per-market labels for logs, DB sessions and responses
+YAHOO_MARKETS = {
+    'commodities': {
+        'label': 'Commodities',
+        'emoji': '🥇',
+        'scan_type': 'manual_commodities',
+        'market_type': 'commodity',
+        'noun': 'commodity',
+        'strength_reason': 'Commodity market strength',
+    },
+    'indices': {
+        'label': 'Indices',
+        'emoji': '📊',
+        'scan_type': 'manual_indices',
+        'market_type': 'index',
+        'noun': 'index',
+        'strength_reason': 'Index market strength',
+    },
+}
+
+# All timeframes like crypto
+SCAN_TIMEFRAMES = ['15m', '1h', '4h']
+
+
+async def scan_yahoo_market(market: str, ai_provider: str) -> Dict:
+    """
+    Scan every symbol of a Yahoo market on all timeframes (15m, 1h, 4h)
+    Like crypto scanner - analyzes all timeframes together
+    """
+    meta = YAHOO_MARKETS[market]
+    label = meta['label']
+    
+    try:
+        logger.info(f"{meta['emoji']} Starting {market} scan (15m, 1h, 4h) with {ai_provider.upper()} AI...")
+        
+        # Initialize fetcher
+        yahoo_fetcher = YahooFetcher()
+        
+        symbols = YahooFetcher.MARKET_SYMBOLS[market]
+        timeframes = SCAN_TIMEFRAMES
+        
+        # Shared scanner - reuses the app's AI clients
+        scanner = get_scanner()
+        
+        # Create scan session in database (SQLite I/O off the event loop)
+        trade_tracker = TradeTracker()
+        scan_id = await asyncio.to_thread(
+            trade_tracker.create_scan_session,
+            scan_type=meta['scan_type'],
+            top_n=len(symbols),
+            timeframes=timeframes,
+            ai_provider=ai_provider
+        )
+        
+        # Scan each symbol on each timeframe (like crypto)
+        all_setups = []
+        for timeframe in timeframes:
+            # Fetch all symbols for this timeframe concurrently
+            candles_by_symbol = await yahoo_fetcher.fetch_ohlcv_many(symbols, timeframe, limit=100)
+            
+            for symbol in symbols:
+                try:
+                    # Get symbol info
+                    symbol_info = yahoo_fetcher.get_symbol_info(symbol)
+                    display_name = symbol_info['name'] if symbol_info else symbol
+                    
+                    logger.info(f"   Analyzing {display_name} on {timeframe.upper()}...")
+                    
+                    # OHLCV data (prefetched above)
+                    ohlcv = candles_by_symbol.get(symbol)
+                    
+                    if not ohlcv or len(ohlcv) < 50:
+                        logger.warning(f"⚠️ Insufficient data for {symbol} on {timeframe}")
+                        continue
+                    
+                    # Get AI analysis
+                    analysis = await scanner.analyze_cached(display_name, ohlcv, timeframe, provider=ai_provider)
+                    
+                    if not analysis or analysis.get('confidence', 0) < settings.MIN_CONFIDENCE_SCORE:
+                        logger.info(f"   {display_name} {timeframe}: Low confidence, skipping")
+                        continue
+                    
+                    # Get current price
+                    current_price = ohlcv[-1][4]  # Close price of last candle
+                    
+                    # Calculate market strength (simplified for Yahoo markets)
+                    market_strength = {
+                        'score': 70,  # Default score for Yahoo markets
+                        'rating': '⚪ Neutral',
+                        'reason': meta['strength_reason']
+                    }
+                    
+                    # Build setup
+                    setup = {
+                        'symbol': display_name,
+                        'yahoo_symbol': symbol,
+                        'timeframe': timeframe,
+                        'direction': analysis.get('direction', 'NEUTRAL'),
+                        'confidence': analysis.get('confidence', 0),
+                        'entry': analysis.get('entry', current_price),
+                        'stop_loss': analysis.get('stop_loss', current_price * 0.98),
+                        'take_profit': analysis.get('take_profit', current_price * 1.02),
+                        'reasoning': analysis.get('reasoning', 'No reasoning provided'),
+                        'market_strength': market_strength,
+                        'ai_provider': ai_provider,
+                        'market_type': meta['market_type']
+                    }
+                    
+                    all_setups.append(setup)
+                    logger.info(f"   ✅ {display_name} {timeframe}: {setup['direction']} @ {setup['confidence']}%")
+                    
+                    # Save to database
+                    await asyncio.to_thread(trade_tracker.save_setup, setup, scan_id=scan_id)
+                
+                except Exception as e:
+                    logger.error(f"❌ Error analyzing {symbol} on {timeframe}: {e}")
+                    continue
+        
+        # Complete scan session
+        high_conf_count = len([s for s in all_setups if s.get('confidence', 0) >= settings.MIN_CONFIDENCE_SCORE])
+        await asyncio.to_thread(
+            trade_tracker.complete_scan_session,
+            scan_id=scan_id,
+            setups_count=len(all_setups),
+            high_confidence_count=high_conf_count
+        )
+        
+        logger.info(f"✅ {label} scan complete - found {len(all_setups)} setups")
+        
+        # Send to Telegram if available
+        try:
+            telegram = TelegramNotifier(
+                bot_token=settings.TELEGRAM_BOT_TOKEN,
+                chat_id=settings.TELEGRAM_CHAT_ID
+            )
+            
+            if telegram.is_available() and all_setups:
+                asyncio.create_task(telegram.send_scan_summary(all_setups, title=f"{meta['emoji']} {label} Scan"))
+                for setup in all_setups:
+                    asyncio.create_task(telegram.send_alert(setup))
+                logger.info(f"📱 Sent {market} alerts to Telegram")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not send Telegram alerts: {e}")
+        
+        return {
+            "success": True,
+            "count": len(all_setups),
+            "setups": all_setups,
+            "message": f"Found {len(all_setups)} {meta['noun']} setups"
+        }
+    
+    except Exception as e:
+        logger.error(f"❌ {label} scan error: {e}")
+        logger.error(traceback.format_exc())
+        return {
+            "success": False,
+            "error": str(e),
+            "count": 0,
+            "setups": []
+        }
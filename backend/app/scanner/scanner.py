@@ -4,25 +4,35 @@ Main scanning logic - coordinates data fetching and AI analysis
 """
 import logging
 import asyncio
+import time
 from typing import List, Dict
-from ..market_data import BinanceFetcher, strength_calculator
+from ..market_data import get_binance_fetcher, strength_calculator
 from ..ai import ClaudeAnalyzer, GroqAnalyzer
+from ..metrics import stage_metrics
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on memoized AI analyses before the cache is reset
+ANALYSIS_CACHE_SIZE = 512
+
+# Seconds a memoized analysis is reused within the same (possibly 4h) candle
+ANALYSIS_TTL = 900
+
+# Candles requested per series - the AI prompt and indicators only read the last 100
+SCAN_CANDLE_LIMIT = 100
+
 
 class TradingScanner:
     def __init__(
         self,
-        binance_key: str = "",
-        binance_secret: str = "",
         claude_key: str = "",
         groq_key: str = "",
         top_n_coins: int = 15,
         min_confidence: int = 60
     ):
         """Initialize scanner with API clients"""
-        self.fetcher = BinanceFetcher(binance_key, binance_secret)
+        # Shared app-wide fetcher (one connection pool and rate-limit budget, keys from settings)
+        self.fetcher = get_binance_fetcher()
         
         # Initialize both AI providers
         self.claude = ClaudeAnalyzer(claude_key)
@@ -35,6 +45,9 @@ class TradingScanner:
         self.top_n_coins = top_n_coins
         self.min_confidence = min_confidence
         
+        # AI analysis memo: (provider, symbol, timeframe, last candle ts) -> (analysed_at, analysis)
+        self._analysis_cache: Dict[tuple, tuple] = {}
+        
         logger.info(f"✅ Trading Scanner initialized (Claude: {self.claude.is_available()}, Groq: {self.groq.is_available()})")
     
     def set_ai_provider(self, provider: str = 'claude'):
@@ -50,6 +63,37 @@ class TradingScanner:
         else:
             logger.warning(f"⚠️  AI provider '{provider}' not available, keeping {self.current_provider}")
     
+    async def analyze_cached(
+        self,
+        symbol: str,
+        ohlcv: List[List],
+        timeframe: str,
+        provider: str = None
+    ) -> Dict:
+        """
+        AI analysis, reused until a new candle closes or ANALYSIS_TTL passes
+        provider: 'claude' or 'groq' (defaults to the current provider)
+        Returns a copy so callers can annotate it freely
+        """
+        provider = provider or self.current_provider
+        ai = self.groq if provider == 'groq' else self.claude
+        
+        key = (provider, symbol, timeframe, ohlcv[-1][0])
+        cached = self._analysis_cache.get(key)
+        if cached and time.monotonic() - cached[0] < ANALYSIS_TTL:
+            # Levels come from the memoized analysis, the price from the latest candle
+            return dict(cached[1], current_price=ohlcv[-1][4])
+        
+        with stage_metrics.timed('ai_analysis'):
+            analysis = await ai.analyze_setup(symbol, ohlcv, timeframe)
+        if analysis:
+            if len(self._analysis_cache) >= ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.clear()
+            self._analysis_cache[key] = (time.monotonic(), analysis)
+            return dict(analysis)
+        
+        return analysis
+    
     async def scan_market(
         self,
         timeframes: List[str] = ['15m', '1h', '4h'],
@@ -73,24 +117,29 @@ class TradingScanner:
         logger.info(f"   Min confidence: {self.min_confidence}")
         
         # Step 1: Get top pairs
-        pairs = await self.fetcher.get_top_pairs(limit=self.top_n_coins)
+        with stage_metrics.timed('top_pairs'):
+            pairs = await self.fetcher.get_top_pairs(limit=self.top_n_coins)
         logger.info(f"📊 Analyzing {len(pairs)} pairs")
         
-        # Step 2: Analyze each pair on each timeframe
+        # Step 2: Download every pair x timeframe up front (bounded fan-out)
+        with stage_metrics.timed('ohlcv_fetch'):
+            candles = await self.fetcher.fetch_ohlcv_many(pairs, timeframes, limit=SCAN_CANDLE_LIMIT)
+        
+        # Step 3: Analyze each pair on each timeframe
         all_setups = []
         
-        for pair in pairs:
+        for rank, pair in enumerate(pairs, 1):
             for tf in timeframes:
                 try:
-                    # Fetch OHLCV
-                    ohlcv = await self.fetcher.fetch_ohlcv(pair, tf, limit=300)
+                    # Prefetched OHLCV
+                    ohlcv = candles[pair].get(tf)
                     
-                    if not ohlcv or len(ohlcv) < 100:
+                    if not ohlcv or len(ohlcv) < SCAN_CANDLE_LIMIT:
                         logger.warning(f"⚠️  Insufficient data for {pair} {tf}")
                         continue
                     
                     # AI Analysis
-                    analysis = await self.ai.analyze_setup(pair, ohlcv, tf)
+                    analysis = await self.analyze_cached(pair, ohlcv, tf)
                     
                     if not analysis:
                         continue
@@ -98,18 +147,19 @@ class TradingScanner:
                     # Calculate Market Strength
                     try:
                         # Get 24h data from first candle stats
-                        volume_24h = sum([c[5] for c in ohlcv[-24:]]) if len(ohlcv) >= 24 else ohlcv[-1][5]
+                        volume_24h = sum(c[5] for c in ohlcv[-24:]) if len(ohlcv) >= 24 else ohlcv[-1][5]
                         price_24h_ago = ohlcv[-24][4] if len(ohlcv) >= 24 else ohlcv[0][4]
                         price_change_24h = ((analysis['current_price'] - price_24h_ago) / price_24h_ago) * 100
                         
-                        strength_data = strength_calculator.calculate_strength(
-                            symbol=pair,
-                            current_price=analysis['current_price'],
-                            volume_24h=volume_24h,
-                            price_change_24h=price_change_24h,
-                            ohlcv_data=ohlcv,
-                            market_ranking=pairs.index(pair) + 1 if pair in pairs else None
-                        )
+                        with stage_metrics.timed('strength'):
+                            strength_data = strength_calculator.calculate_strength(
+                                symbol=pair,
+                                current_price=analysis['current_price'],
+                                volume_24h=volume_24h,
+                                price_change_24h=price_change_24h,
+                                ohlcv_data=ohlcv,
+                                market_ranking=rank
+                            )
                         
                         # Add strength to analysis
                         analysis['market_strength'] = strength_data
@@ -134,7 +184,7 @@ class TradingScanner:
                     logger.error(f"❌ Error analyzing {pair} {tf}: {e}")
                     continue
         
-        # Step 3: Sort by confidence and get top N
+        # Step 4: Sort by confidence and get top N
         all_setups.sort(key=lambda x: x.get('confidence', 0), reverse=True)
         top_setups = all_setups[:max_results]
         
@@ -152,12 +202,32 @@ class TradingScanner:
         """
         logger.info(f"🔍 Quick scan: {symbol} {timeframe}")
         
-        ohlcv = await self.fetcher.fetch_ohlcv(symbol, timeframe, limit=300)
+        with stage_metrics.timed('ohlcv_fetch'):
+            ohlcv = await self.fetcher.fetch_ohlcv(symbol, timeframe, limit=SCAN_CANDLE_LIMIT)
         
         if not ohlcv:
             return {"error": "Failed to fetch data"}
         
-        analysis = await self.ai.analyze_setup(symbol, ohlcv, timeframe)
+        analysis = await self.analyze_cached(symbol, ohlcv, timeframe)
         
         return analysis or {"error": "Analysis failed"}
-
+    
+    async def quick_scan_many(self, symbols: List[str], timeframes: List[str]) -> Dict[str, Dict]:
+        """
+        Quick scan every symbol x timeframe concurrently
+        Returns: {'BTC/USDT_15m': {...}, ...}
+        """
+        pairs = [(symbol, tf) for symbol in symbols for tf in timeframes]
+        results = await asyncio.gather(
+            *(self.quick_scan(symbol, tf) for symbol, tf in pairs),
+            return_exceptions=True
+        )
+        
+        batch = {}
+        for (symbol, tf), result in zip(pairs, results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ Quick scan error for {symbol} {tf}: {result}")
+                result = {"error": str(result)}
+            batch[f"{symbol}_{tf}"] = result
+        
+        return batch
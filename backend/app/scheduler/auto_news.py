@@ -8,6 +8,7 @@ from datetime import datetime
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from pytz import UTC
+from app.admin.system_controller import system_controller
 
 from ..news.feeds import news_scraper
 from ..news.article_generator import article_generator
@@ -37,7 +38,6 @@ class AutoNewsScheduler:
         """Generate article for a category and post to Telegram"""
         try:
             # Check if system is enabled
-            from app.admin.system_controller import system_controller
             if not system_controller.is_enabled:
                 logger.warning("🔴 SYSTEM DISABLED - Skipping news article generation")
                 return
@@ -3,9 +3,12 @@ Automatic hourly scanning scheduler
 """
 import logging
 import asyncio
+import traceback
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from datetime import datetime
+from app.admin.system_controller import system_controller
+from ..config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +27,6 @@ class AutoScanner:
         """Execute 4h scan (synchronized with candle close)"""
         try:
             # Check if system is enabled
-            from app.admin.system_controller import system_controller
             if not system_controller.is_enabled:
                 logger.warning("🔴 SYSTEM DISABLED - Skipping auto-scan")
                 return
@@ -40,7 +42,6 @@ class AutoScanner:
             
             # Scan market - ONLY 4H timeframe
             # Use configured AI provider for auto-scans
-            from ..config import settings
             ai_provider = settings.AUTO_SCAN_AI_PROVIDER
             
             logger.info(f"   Using AI: {ai_provider.upper()}")
@@ -80,7 +81,6 @@ class AutoScanner:
             
         except Exception as e:
             logger.error(f"❌ Auto scan error: {e}")
-            import traceback
             logger.error(traceback.format_exc())
     
     def start(self):
@@ -4,9 +4,13 @@ Runs 30 minutes after 4H candle close to ensure Yahoo Finance data is available
 """
 import logging
 import asyncio
+import traceback
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from datetime import datetime
+from app.admin.system_controller import system_controller
+from ..config import settings
+from ..market_data.yahoo_fetcher import YahooFetcher
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +18,8 @@ logger = logging.getLogger(__name__)
 class AutoScannerCommodities:
     """Handles automatic scheduled scans for Commodities (Yahoo Finance)"""
     
-    def __init__(self, telegram, trade_tracker):
+    def __init__(self, scanner, telegram, trade_tracker):
+        self.scanner = scanner
         self.telegram = telegram
         self.trade_tracker = trade_tracker
         self.scheduler = AsyncIOScheduler()
@@ -24,17 +29,12 @@ class AutoScannerCommodities:
         """Execute 4h commodities scan (30 min after candle close for Yahoo data delay)"""
         try:
             # Check if system is enabled
-            from app.admin.system_controller import system_controller
             if not system_controller.is_enabled:
                 logger.warning("🔴 SYSTEM DISABLED - Skipping commodities auto-scan")
                 return
             
             logger.info("🥇 Starting automatic COMMODITIES 4H scan (30min after candle close)...")
             
-            from ..market_data.yahoo_fetcher import YahooFetcher
-            from ..scanner.scanner import TradingScanner
-            from ..config import settings
-            
             # Create scan session
             scan_id = self.trade_tracker.create_scan_session(
                 scan_type='auto_commodities_4h',
@@ -45,24 +45,17 @@ class AutoScannerCommodities:
             
             # Initialize Yahoo fetcher
             yahoo_fetcher = YahooFetcher()
-            commodities = ['GC=F', 'CL=F', 'SI=F', 'ZW=F']  # Gold, Oil, Silver, Wheat
-            
-            # Initialize scanner with Yahoo fetcher
-            scanner = TradingScanner(
-                binance_key="",
-                binance_secret="",
-                claude_key=settings.ANTHROPIC_API_KEY,
-                groq_key=settings.GROQ_API_KEY,
-                top_n_coins=3,
-                min_confidence=settings.MIN_CONFIDENCE_SCORE
-            )
+            commodities = YahooFetcher.MARKET_SYMBOLS['commodities']  # Gold, Oil, Silver, Wheat
             
+            # Shared app scanner (AI clients + analysis cache)
+            scanner = self.scanner
             ai_provider = settings.AUTO_SCAN_AI_PROVIDER
-            scanner.set_ai_provider(ai_provider)
-            scanner.fetcher = yahoo_fetcher
             
             logger.info(f"   Using AI: {ai_provider.upper()}")
             
+            # Fetch all symbols concurrently
+            candles_by_symbol = await yahoo_fetcher.fetch_ohlcv_many(commodities, '4h', limit=100)
+            
             # Scan each commodity
             all_setups = []
             for symbol in commodities:
@@ -73,18 +66,15 @@ class AutoScannerCommodities:
                     
                     logger.info(f"   Analyzing {display_name} ({symbol})...")
                     
-                    # Fetch OHLCV data
-                    ohlcv = await yahoo_fetcher.fetch_ohlcv(symbol, '4h', limit=100)
+                    # OHLCV data (prefetched above)
+                    ohlcv = candles_by_symbol.get(symbol)
                     
                     if not ohlcv or len(ohlcv) < 50:
                         logger.warning(f"⚠️ Insufficient data for {symbol}")
                         continue
                     
                     # Get AI analysis
-                    if ai_provider == 'claude':
-                        analysis = await scanner.claude.analyze_setup(display_name, ohlcv, '4h')
-                    else:
-                        analysis = await scanner.groq.analyze_setup(display_name, ohlcv, '4h')
+                    analysis = await scanner.analyze_cached(display_name, ohlcv, '4h', provider=ai_provider)
                     
                     if not analysis or analysis.get('confidence', 0) < settings.MIN_CONFIDENCE_SCORE:
                         logger.info(f"   {display_name}: Low confidence, skipping")
@@ -149,7 +139,6 @@ class AutoScannerCommodities:
             
         except Exception as e:
             logger.error(f"❌ Auto commodities scan error: {e}")
-            import traceback
             logger.error(traceback.format_exc())
     
     def start(self):
@@ -5,9 +5,13 @@ Runs 1 hour after 4H candle close to ensure Yahoo Finance data is available
 """
 import logging
 import asyncio
+import traceback
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from datetime import datetime
+from app.admin.system_controller import system_controller
+from ..config import settings
+from ..market_data.yahoo_fetcher import YahooFetcher
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +19,8 @@ logger = logging.getLogger(__name__)
 class AutoScannerIndices:
     """Handles automatic scheduled scans for Indices (Yahoo Finance)"""
     
-    def __init__(self, telegram, trade_tracker):
+    def __init__(self, scanner, telegram, trade_tracker):
+        self.scanner = scanner
         self.telegram = telegram
         self.trade_tracker = trade_tracker
         self.scheduler = AsyncIOScheduler()
@@ -25,17 +30,12 @@ class AutoScannerIndices:
         """Execute 4h indices scan (1h after candle close for Yahoo data delay)"""
         try:
             # Check if system is enabled
-            from app.admin.system_controller import system_controller
             if not system_controller.is_enabled:
                 logger.warning("🔴 SYSTEM DISABLED - Skipping indices auto-scan")
                 return
             
             logger.info("📊 Starting automatic INDICES 4H scan (Top 8 global indices - 1h after candle close)...")
             
-            from ..market_data.yahoo_fetcher import YahooFetcher
-            from ..scanner.scanner import TradingScanner
-            from ..config import settings
-            
             # Create scan session
             scan_id = self.trade_tracker.create_scan_session(
                 scan_type='auto_indices_4h',
@@ -46,24 +46,17 @@ class AutoScannerIndices:
             
             # Initialize Yahoo fetcher
             yahoo_fetcher = YahooFetcher()
-            indices = ['^GSPC', '^DJI', '^IXIC', '^GDAXI', '^FTSE', 'FTSEMIB.MI', '^N225', '^HSI']
-            
-            # Initialize scanner with Yahoo fetcher
-            scanner = TradingScanner(
-                binance_key="",
-                binance_secret="",
-                claude_key=settings.ANTHROPIC_API_KEY,
-                groq_key=settings.GROQ_API_KEY,
-                top_n_coins=8,
-                min_confidence=settings.MIN_CONFIDENCE_SCORE
-            )
+            indices = YahooFetcher.MARKET_SYMBOLS['indices']
             
+            # Shared app scanner (AI clients + analysis cache)
+            scanner = self.scanner
             ai_provider = settings.AUTO_SCAN_AI_PROVIDER
-            scanner.set_ai_provider(ai_provider)
-            scanner.fetcher = yahoo_fetcher
             
             logger.info(f"   Using AI: {ai_provider.upper()}")
             
+            # Fetch all symbols concurrently
+            candles_by_symbol = await yahoo_fetcher.fetch_ohlcv_many(indices, '4h', limit=100)
+            
             # Scan each index
             all_setups = []
             for symbol in indices:
@@ -74,18 +67,15 @@ class AutoScannerIndices:
                     
                     logger.info(f"   Analyzing {display_name} ({symbol})...")
                     
-                    # Fetch OHLCV data
-                    ohlcv = await yahoo_fetcher.fetch_ohlcv(symbol, '4h', limit=100)
+                    # OHLCV data (prefetched above)
+                    ohlcv = candles_by_symbol.get(symbol)
                     
                     if not ohlcv or len(ohlcv) < 50:
                         logger.warning(f"⚠️ Insufficient data for {symbol}")
                         continue
                     
                     # Get AI analysis
-                    if ai_provider == 'claude':
-                        analysis = await scanner.claude.analyze_setup(display_name, ohlcv, '4h')
-                    else:
-                        analysis = await scanner.groq.analyze_setup(display_name, ohlcv, '4h')
+                    analysis = await scanner.analyze_cached(display_name, ohlcv, '4h', provider=ai_provider)
                     
                     if not analysis or analysis.get('confidence', 0) < settings.MIN_CONFIDENCE_SCORE:
                         logger.info(f"   {display_name}: Low confidence, skipping")
@@ -150,7 +140,6 @@ class AutoScannerIndices:
             
         except Exception as e:
             logger.error(f"❌ Auto indices scan error: {e}")
-            import traceback
             logger.error(traceback.format_exc())
     
     def start(self):
@@ -0,0 +1,37 @@
+"""
+Single-flight request coalescing
+Concurrent calls for the same key share one in-flight fetch
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Keyed in-flight futures: the first caller (leader) runs the fetch, later
+    callers with the same key await its result instead of fetching again
+    """
+    
+    def __init__(self, default: Any = None):
+        # Handed to waiters when the leader is cancelled or raises
+        self.default = default
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+    
+    async def do(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Result of fetch() for key, shared with every concurrent caller"""
+        pending = self._inflight.get(key)
+        if pending is not None:
+            # Shielded - a cancelled waiter must not cancel the shared future
+            return await asyncio.shield(pending)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fetch()
+            future.set_result(result)
+            return result
+        finally:
+            # Cancelled or failed leader - waiters get the default instead of hanging
+            if not future.done():
+                future.set_result(self.default)
+            self._inflight.pop(key, None)
@@ -3,12 +3,21 @@ Telegram Bot Notifier
 Sends trading alerts to Telegram channel
 """
 import logging
+from datetime import datetime
+from types import MappingProxyType
 from typing import List, Dict
 from telegram import Bot
 from telegram.error import TelegramError
 
 logger = logging.getLogger(__name__)
 
+# Signal direction -> emoji (read-only, built once)
+DIRECTION_EMOJI = MappingProxyType({
+    'LONG': '🟢',
+    'SHORT': '🔴',
+    'NEUTRAL': '⚪'
+})
+
 
 class TelegramNotifier:
     def __init__(self, bot_token: str, chat_id: str):
@@ -71,11 +80,7 @@ class TelegramNotifier:
         
         try:
             # Format message
-            direction_emoji = {
-                'LONG': '🟢',
-                'SHORT': '🔴',
-                'NEUTRAL': '⚪'
-            }.get(setup.get('direction', 'NEUTRAL'), '⚪')
+            direction_emoji = DIRECTION_EMOJI.get(setup.get('direction', 'NEUTRAL'), '⚪')
             
             # Get AI provider (default to Claude for backward compatibility)
             ai_provider = setup.get('ai_provider', 'claude').upper()
@@ -257,7 +262,6 @@ class TelegramNotifier:
             if not created_at or not closed_at:
                 return "N/A"
             
-            from datetime import datetime
             if isinstance(created_at, str):
                 created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
             if isinstance(closed_at, str):
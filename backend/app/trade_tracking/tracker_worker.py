@@ -5,8 +5,9 @@ Automatically checks open trades for TP/SL hits
 import logging
 import asyncio
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional
 from sqlalchemy.orm import Session
+from app.admin.system_controller import system_controller
 from ..database.models import TradeSetup
 from ..database.connection import SessionLocal
 from ..market_data import BinanceFetcher
@@ -48,7 +49,6 @@ class TradeTrackerWorker:
     async def check_all_open_trades(self):
         """Check all open trades for TP/SL hits"""
         # Check if system is enabled
-        from app.admin.system_controller import system_controller
         if not system_controller.is_enabled:
             logger.debug("🔴 SYSTEM DISABLED - Skipping trade tracking")
             return
@@ -66,13 +66,24 @@ class TradeTrackerWorker:
             
             logger.info(f"🔍 Checking {len(open_trades)} open trades...")
             
+            # One batched ticker call for every distinct symbol
+            symbols = list({trade.symbol for trade in open_trades})
+            prices = await self.fetcher.fetch_prices(symbols)
+            
+            # Listed symbols the batch couldn't price fall back to per-symbol fetches, in flight together
+            markets = self.fetcher.exchange.markets or {}
+            missing = [s for s in symbols if s not in prices and s in markets]
+            if missing:
+                fallback = await asyncio.gather(*(self.get_current_price(s) for s in missing))
+                prices.update((s, price) for s, price in zip(missing, fallback) if price)
+            
             checked = 0
             updated = 0
             
             for trade in open_trades:
                 try:
                     # Check if trade should be closed
-                    outcome = await self.check_trade_outcome(trade)
+                    outcome = await self.check_trade_outcome(trade, prices.get(trade.symbol), prefetched=True)
                     
                     if outcome:
                         # Update trade in database
@@ -114,9 +125,6 @@ class TradeTrackerWorker:
                     
                     checked += 1
                     
-                    # Small delay between checks
-                    await asyncio.sleep(0.1)
-                    
                 except Exception as e:
                     logger.error(f"❌ Error checking trade #{trade.id}: {e}")
                     continue
@@ -130,9 +138,16 @@ class TradeTrackerWorker:
         finally:
             db.close()
     
-    async def check_trade_outcome(self, trade: TradeSetup) -> dict:
+    async def check_trade_outcome(
+        self,
+        trade: TradeSetup,
+        current_price: Optional[float] = None,
+        prefetched: bool = False
+    ) -> dict:
         """
         Check if a trade has hit TP, SL, or expired
+        current_price: prefetched price (fetched here when not given)
+        prefetched: a price lookup already ran - a missing price is not fetched again
         
         Returns None if still open, or dict with outcome
         """
@@ -148,8 +163,9 @@ class TradeTrackerWorker:
                     'profit_loss_pct': 0.0
                 }
             
-            # Fetch current price
-            current_price = await self.get_current_price(trade.symbol)
+            # Fetch current price (unless prefetched)
+            if current_price is None and not prefetched:
+                current_price = await self.get_current_price(trade.symbol)
             
             if not current_price:
                 return None
@@ -201,7 +217,11 @@ class TradeTrackerWorker:
             return None
     
     async def get_current_price(self, symbol: str) -> float:
-        """Get current price for a symbol"""
+        """Get current price for a symbol (None for symbols Binance doesn't list)"""
+        markets = self.fetcher.exchange.markets
+        if markets and symbol not in markets:
+            return None
+        
         try:
             # Fetch latest candle
             ohlcv = await self.fetcher.fetch_ohlcv(symbol, '1m', limit=1)
@@ -0,0 +1,87 @@
+"""
+BinanceFetcher cache/stream paths must never serve candle series with holes
+Run from backend/: python -m pytest tests
+"""
+import asyncio
+import pytest
+
+pytest.importorskip("ccxt")
+pytest.importorskip("sqlalchemy")
+
+from app.market_data import binance_fetcher
+from app.market_data.binance_fetcher import BinanceFetcher
+
+TF_MS = 15 * 60 * 1000
+
+
+class FakeExchange:
+    def __init__(self, now_ms: int):
+        self.now_ms = now_ms
+
+    def parse_timeframe(self, timeframe: str) -> int:
+        return TF_MS // 1000
+
+    def milliseconds(self) -> int:
+        return self.now_ms
+
+
+class FakeStream:
+    def __init__(self, live):
+        self.live = live
+
+    def live_candle(self, symbol: str, timeframe: str):
+        return self.live
+
+
+def candle(i: int):
+    return [i * TF_MS, 1.0, 1.0, 1.0, 1.0, 1.0]
+
+
+def make_fetcher(live=None, now_index: int = 0) -> BinanceFetcher:
+    fetcher = BinanceFetcher.__new__(BinanceFetcher)
+    fetcher.exchange = FakeExchange(now_index * TF_MS)
+    fetcher.stream = FakeStream(live) if live else None
+    return fetcher
+
+
+def test_from_stream_serves_contiguous_series():
+    cached = [candle(i) for i in range(100)]
+    fetcher = make_fetcher(live=candle(100))
+
+    ohlcv = fetcher._from_stream('BTC/USDT', '15m', 100, cached)
+
+    assert [c[0] for c in ohlcv] == [i * TF_MS for i in range(1, 101)]
+
+
+def test_from_stream_rejects_reconnect_gap():
+    # 10 closes lost during a reconnect, then one streamed close appended after the hole
+    cached = [candle(i) for i in range(10, 109)] + [candle(119)]
+    fetcher = make_fetcher(live=candle(120))
+
+    assert fetcher._from_stream('BTC/USDT', '15m', 100, cached) is None
+
+
+def test_incremental_since_resumes_contiguous_cache():
+    cached = [candle(i) for i in range(100)]
+    fetcher = make_fetcher(now_index=101)
+
+    assert fetcher._incremental_since(cached, '15m', 100) == 99 * TF_MS
+
+
+def test_incremental_since_rejects_cache_with_hole():
+    cached = [candle(i) for i in range(10, 109)] + [candle(119)]
+    fetcher = make_fetcher(now_index=120)
+
+    assert fetcher._incremental_since(cached, '15m', 100) is None
+
+
+def test_store_cached_skips_open_candle(monkeypatch):
+    stored = []
+    monkeypatch.setattr(binance_fetcher.ohlcv_cache, 'append', lambda symbol, tf, ohlcv: stored.extend(ohlcv))
+    # Candle 99 is still open one millisecond before it closes
+    fetcher = make_fetcher()
+    fetcher.exchange.now_ms = 100 * TF_MS - 1
+
+    asyncio.run(fetcher._store_cached('BTC/USDT', '15m', 100, [candle(i) for i in range(100)]))
+
+    assert [c[0] for c in stored] == [i * TF_MS for i in range(99)]